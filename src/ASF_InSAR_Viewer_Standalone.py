@@ -10,9 +10,14 @@ Version: 1.0
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 import numpy as np
+import functools
 import os
-import glob
+import re
 import sys
+import threading
+import warnings
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 # Handle matplotlib backend for exe
 import matplotlib
@@ -20,7 +25,14 @@ matplotlib.use('TkAgg')
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 from matplotlib.figure import Figure
-from matplotlib.colors import LinearSegmentedColormap
+from matplotlib.cm import ScalarMappable
+from matplotlib.colors import LinearSegmentedColormap, ListedColormap, Normalize
+
+# GDAL tuning - must be set before rasterio/GDAL are imported
+os.environ.setdefault("GDAL_DISABLE_READDIR_ON_OPEN", "EMPTY_DIR")
+os.environ.setdefault("GDAL_CACHEMAX", "512")
+os.environ.setdefault("GDAL_NUM_THREADS", "ALL_CPUS")
+os.environ.setdefault("CPL_VSIL_CURL_ALLOWED_EXTENSIONS", ".tif,.tiff")
 
 # Try imports with fallbacks
 HAS_RASTERIO = False
@@ -28,6 +40,7 @@ HAS_GDAL = False
 
 try:
     import rasterio
+    from rasterio.enums import Resampling
     HAS_RASTERIO = True
 except ImportError:
     pass
@@ -40,6 +53,34 @@ if not HAS_RASTERIO:
     except ImportError:
         pass
 
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+try:
+    import bottleneck as bn
+    HAS_BOTTLENECK = True
+except ImportError:
+    HAS_BOTTLENECK = False
+
+try:
+    import numexpr as ne
+    HAS_NUMEXPR = True
+except ImportError:
+    HAS_NUMEXPR = False
+
+# Display-range estimation
+PERCENTILE_BINS = 4096
+PERCENTILE_SAMPLE = 200000
+
+# Number of decoded rasters kept in memory
+RASTER_CACHE_SIZE = 4
+
+# Files smaller than this load fast enough to skip the progress animation
+PROGRESS_MIN_BYTES = 8 * 1024 * 1024
+
 
 def resource_path(relative_path):
     """Get absolute path to resource, works for dev and for PyInstaller"""
@@ -50,6 +91,73 @@ def resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 
+if HAS_NUMBA:
+    @njit(cache=True)
+    def _hist_percentiles(flat, lo, hi, bins):
+        """Two-pass histogram percentile over the finite values of a 1-D array"""
+        vmin = np.inf
+        vmax = -np.inf
+        count = 0
+        for x in flat:
+            if np.isfinite(x):
+                count += 1
+                if x < vmin:
+                    vmin = x
+                if x > vmax:
+                    vmax = x
+        if count == 0:
+            return np.nan, np.nan
+        if vmax == vmin:
+            return vmin, vmax
+        
+        hist = np.zeros(bins, np.int64)
+        scale = bins / (vmax - vmin)
+        for x in flat:
+            if np.isfinite(x):
+                k = int((x - vmin) * scale)
+                if k >= bins:
+                    k = bins - 1
+                hist[k] += 1
+        
+        lo_count = lo / 100.0 * count
+        hi_count = hi / 100.0 * count
+        lo_val = vmin
+        hi_val = vmax
+        found_lo = False
+        cum = 0
+        for k in range(bins):
+            cum += hist[k]
+            if not found_lo and cum >= lo_count:
+                lo_val = vmin + k / scale
+                found_lo = True
+            if cum >= hi_count:
+                hi_val = vmin + (k + 1) / scale
+                break
+        return lo_val, hi_val
+
+
+def approx_percentiles(data, lo=2, hi=98):
+    """Approximate (lo, hi) percentiles of the finite values in data
+    
+    Uses a Numba histogram pass when available, otherwise a random sample
+    of at most PERCENTILE_SAMPLE pixels. Returns (0, 1) if nothing is finite.
+    """
+    flat = np.ascontiguousarray(data).ravel()
+    if HAS_NUMBA:
+        vmin, vmax = _hist_percentiles(flat, float(lo), float(hi), PERCENTILE_BINS)
+    else:
+        if flat.size > PERCENTILE_SAMPLE:
+            rng = np.random.default_rng(0)
+            flat = flat[rng.integers(0, flat.size, PERCENTILE_SAMPLE)]
+        # nanpercentile skips NaNs without a compacted copy of the valid pixels
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)  # all-NaN input
+            vmin, vmax = np.nanpercentile(flat, [lo, hi])
+    if not np.isfinite(vmin):
+        return 0, 1
+    return float(vmin), float(vmax)
+
+
 class ASFInSARViewer:
     def __init__(self, root):
         self.root = root
@@ -92,6 +200,17 @@ class ASFInSARViewer:
         self.current_file = None
         self.geo_transform = None
         self.projection = None
+        self.source_shape = None
+        self.has_overviews = False
+        self.auto_range = None  # (data, (vmin, vmax))
+        self._raster_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._load_id = 0
+        self._ptype_cache = {}  # filepath -> product type
+        self._norm_buffer = None
+        self._im = None
+        self._mappable = None
+        self._cbar = None
         
         # Custom colormaps
         self.custom_cmaps = self.create_insar_colormaps()
@@ -108,6 +227,9 @@ class ASFInSARViewer:
             'incidence': ['inc', 'incidence', 'lv_theta'],
             'azimuth': ['lv_phi', 'azimuth']
         }
+        self.product_regex = re.compile('|'.join(
+            f"(?P<{product_type}>{'|'.join(map(re.escape, patterns))})"
+            for product_type, patterns in self.product_patterns.items()))
         
         self.setup_styles()
         self.create_widgets()
@@ -140,8 +262,13 @@ class ASFInSARViewer:
         dem_colors = ['#006400', '#228B22', '#90EE90', '#FFFF00', '#FFA500', '#8B4513', '#FFFFFF']
         custom_cmaps['terrain'] = LinearSegmentedColormap.from_list('terrain_custom', dem_colors, N=256)
         
+        # Bake into lookup tables so evaluation is a plain table gather
+        for key, cmap in custom_cmaps.items():
+            custom_cmaps[key] = ListedColormap(cmap(np.linspace(0, 1, 256)), name=cmap.name)
+        
         return custom_cmaps
     
+    @functools.lru_cache(maxsize=32)
     def get_colormap(self, name):
         """Get colormap by name"""
         if name in self.custom_cmaps:
@@ -151,14 +278,23 @@ class ASFInSARViewer:
         except:
             return plt.get_cmap('viridis')
     
+    @functools.lru_cache(maxsize=32)
+    def get_lut(self, name):
+        """256-entry uint8 RGBA lookup table for a colormap"""
+        return self.get_colormap(name)(np.linspace(0, 1, 256), bytes=True)
+    
     def detect_product_type(self, filename):
         """Detect InSAR product type from filename"""
-        fname_lower = filename.lower()
-        for product_type, patterns in self.product_patterns.items():
-            for pattern in patterns:
-                if pattern in fname_lower:
-                    return product_type
-        return 'unknown'
+        match = self.product_regex.search(filename.lower())
+        return match.lastgroup if match else 'unknown'
+    
+    def get_product_type(self, filepath):
+        """Product type of a file, cached per path"""
+        product_type = self._ptype_cache.get(filepath)
+        if product_type is None:
+            product_type = self.detect_product_type(os.path.basename(filepath))
+            self._ptype_cache[filepath] = product_type
+        return product_type
     
     def get_default_colormap(self, product_type):
         """Get appropriate colormap for product type"""
@@ -360,6 +496,7 @@ class ASFInSARViewer:
         plt.style.use('dark_background')
         
         self.fig = Figure(figsize=(10, 8), facecolor=self.colors['bg_dark'])
+        self.fig.subplots_adjust(left=0.08, right=0.88, top=0.92, bottom=0.08)
         self.ax = self.fig.add_subplot(111)
         self.ax.set_facecolor(self.colors['bg_medium'])
         self.ax.text(0.5, 0.5, 'ASF InSAR Product Viewer\n\nSelect a folder to begin',
@@ -409,32 +546,36 @@ class ASFInSARViewer:
         try:
             self.progress.start(10)
             self.status_var.set("Scanning for GeoTIFF files...")
-            self.root.update()
+            self.root.update_idletasks()
             
-            # Find all TIF files
-            self.tif_files = []
-            for ext in ['*.tif', '*.tiff', '*.TIF', '*.TIFF']:
-                self.tif_files.extend(glob.glob(os.path.join(folder, ext)))
+            # Find all TIF files (single directory pass, case-insensitive)
+            with os.scandir(folder) as entries:
+                self.tif_files = [entry.path for entry in entries
+                                  if entry.is_file() and entry.name.lower().endswith(('.tif', '.tiff'))]
             
             if not self.tif_files:
                 messagebox.showwarning("Warning", "No GeoTIFF files found in this folder!")
                 self.progress.stop()
                 return
             
-            # Sort and populate listbox
+            # Sort and populate listbox in a single insert
             self.tif_files.sort()
-            self.product_listbox.delete(0, tk.END)
+            display_names = []
             
             for tif_path in self.tif_files:
                 fname = os.path.basename(tif_path)
                 product_type = self.detect_product_type(fname)
+                self._ptype_cache[tif_path] = product_type
                 
                 if product_type != 'unknown':
                     display_name = f"[{product_type.upper()}] {fname[:35]}..."
                 else:
                     display_name = fname[:45] + "..." if len(fname) > 45 else fname
                 
-                self.product_listbox.insert(tk.END, display_name)
+                display_names.append(display_name)
+            
+            self.product_listbox.delete(0, tk.END)
+            self.product_listbox.insert(tk.END, *display_names)
             
             info_text = f"Folder: {os.path.basename(folder)}\n"
             info_text += f"Products found: {len(self.tif_files)}\n\n"
@@ -454,57 +595,168 @@ class ASFInSARViewer:
             idx = selection[0]
             self.display_product(self.tif_files[idx])
     
-    def read_geotiff(self, filepath):
-        """Read GeoTIFF using rasterio or GDAL"""
+    def get_display_shape(self):
+        """Canvas size in pixels as (height, width)"""
+        width, height = self.fig.get_size_inches() * self.fig.dpi
+        return int(height), int(width)
+    
+    def fit_shape(self, shape, out_shape):
+        """Largest shape that fits in out_shape while keeping the aspect ratio"""
+        height, width = shape
+        if out_shape is None:
+            return height, width
+        scale = min(1.0, out_shape[0] / height, out_shape[1] / width)
+        return max(1, int(round(height * scale))), max(1, int(round(width * scale)))
+    
+    def read_geotiff(self, filepath, out_shape=None):
+        """Read GeoTIFF using rasterio or GDAL
+        
+        If out_shape (height, width) is given, the band is decimated on read
+        to fit inside it, using the file's overviews when available.
+        Returns (data, meta) with data as float32. Does not touch viewer
+        state, so it is safe to call from worker threads.
+        """
         if HAS_RASTERIO:
             with rasterio.open(filepath) as src:
-                data = src.read(1).astype(np.float64)
-                self.geo_transform = src.transform
-                self.projection = src.crs
-                nodata = src.nodata
-                
-                if nodata is not None:
-                    data = np.where(data == nodata, np.nan, data)
-                
-                return data
+                shape = self.fit_shape((src.height, src.width), out_shape)
+                # Masked read flags nodata/mask-band pixels; fill them with NaN
+                data = src.read(1, masked=True, out_shape=shape, resampling=Resampling.average)
+                data = data.astype(np.float32, copy=False).filled(np.nan)
+                meta = {
+                    'transform': src.transform * src.transform.scale(
+                        src.width / shape[1], src.height / shape[0]),
+                    'crs': src.crs,
+                    'height': src.height,
+                    'width': src.width,
+                    'has_overviews': bool(src.overviews(1))
+                }
+                return data, meta
                 
         elif HAS_GDAL:
             ds = gdal.Open(filepath)
             if ds is None:
                 raise Exception(f"Could not open: {filepath}")
             
-            data = ds.ReadAsArray().astype(np.float64)
-            self.geo_transform = ds.GetGeoTransform()
-            self.projection = ds.GetProjection()
-            nodata = ds.GetRasterBand(1).GetNoDataValue()
-            ds = None
+            band = ds.GetRasterBand(1)
+            shape = self.fit_shape((ds.RasterYSize, ds.RasterXSize), out_shape)
+            data = band.ReadAsArray(buf_xsize=shape[1], buf_ysize=shape[0],
+                                    resample_alg=gdal.GRIORA_Average)
+            data = data.astype(np.float32, copy=False)
+            
+            # Invalid pixels come from the band's mask (nodata, alpha or .msk)
+            if band.GetMaskFlags() != gdal.GMF_ALL_VALID:
+                mask = band.GetMaskBand().ReadAsArray(buf_xsize=shape[1], buf_ysize=shape[0])
+                data[mask == 0] = np.nan
             
-            if nodata is not None:
-                data = np.where(data == nodata, np.nan, data)
+            sx = ds.RasterXSize / shape[1]
+            sy = ds.RasterYSize / shape[0]
+            gt = ds.GetGeoTransform()
+            meta = {
+                'transform': (gt[0], gt[1] * sx, gt[2] * sy, gt[3], gt[4] * sx, gt[5] * sy),
+                'crs': ds.GetProjection(),
+                'height': ds.RasterYSize,
+                'width': ds.RasterXSize,
+                'has_overviews': band.GetOverviewCount() > 0
+            }
+            band = None
+            ds = None
             
-            return data
+            return data, meta
         else:
             raise Exception("No GeoTIFF reader available. Install rasterio.")
     
+    def to_rgba(self, data, cmap_name, vmin, vmax):
+        """Apply colormap to data as a uint8 RGBA image, NaNs transparent"""
+        span = (vmax - vmin) or 1.0
+        lo = np.float32(vmin)
+        scale = np.float32(256.0 / span)
+        
+        # Reuse one scratch buffer across redraws of same-shaped rasters
+        if self._norm_buffer is None or self._norm_buffer.shape != data.shape:
+            self._norm_buffer = np.empty(data.shape, dtype=np.float32)
+        idx = self._norm_buffer
+        if HAS_NUMEXPR:
+            ne.evaluate('(data - lo) * scale', out=idx, casting='same_kind')
+        else:
+            np.subtract(data, lo, out=idx)
+            idx *= scale
+        np.clip(idx, 0, 255, out=idx)
+        invalid = np.isnan(idx)
+        idx[invalid] = 0
+        rgba = self.get_lut(cmap_name)[idx.astype(np.uint8)]
+        rgba[invalid, 3] = 0
+        return rgba
+    
+    def load_raster(self, filepath, out_shape):
+        """read_geotiff with a small LRU cache keyed on path, mtime and shape"""
+        key = (filepath, os.path.getmtime(filepath), out_shape)
+        with self._cache_lock:
+            if key in self._raster_cache:
+                self._raster_cache.move_to_end(key)
+                return self._raster_cache[key]
+        
+        result = self.read_geotiff(filepath, out_shape=out_shape)
+        with self._cache_lock:
+            self._raster_cache[key] = result
+            if len(self._raster_cache) > RASTER_CACHE_SIZE:
+                self._raster_cache.popitem(last=False)
+        return result
+    
     def display_product(self, filepath):
-        try:
+        """Load filepath on a worker thread and render it when ready"""
+        self._load_id += 1
+        # Only animate the progress bar for files that take noticeable time
+        if os.path.getsize(filepath) > PROGRESS_MIN_BYTES:
             self.progress.start(10)
-            fname = os.path.basename(filepath)
-            self.status_var.set(f"Loading {fname}...")
-            self.root.update()
-            
-            # Read data
-            data = self.read_geotiff(filepath)
-            self.current_data = data
-            self.current_file = filepath
-            
-            # Handle multi-band
-            if len(data.shape) == 3:
-                data = data[0]
-                self.current_data = data
+        self.status_var.set(f"Loading {os.path.basename(filepath)}...")
+        
+        # Read data, decimated to the canvas size
+        threading.Thread(target=self._load_async,
+                         args=(self._load_id, filepath, self.get_display_shape()),
+                         daemon=True).start()
+    
+    def _load_async(self, load_id, filepath, out_shape):
+        """Background worker: read raster and estimate its display range"""
+        try:
+            data, meta = self.load_raster(filepath, out_shape)
+            auto_range = approx_percentiles(data)
+            self.root.after(0, lambda: self._render(load_id, filepath, data, meta, auto_range))
+        except Exception as e:
+            self.root.after(0, lambda err=str(e): self._load_failed(load_id, err))
+    
+    def _render(self, load_id, filepath, data, meta, auto_range):
+        """Main-thread half of display_product; drops results of superseded loads"""
+        if load_id != self._load_id:
+            return
+        self.progress.stop()
+        
+        self.geo_transform = meta['transform']
+        self.projection = meta['crs']
+        self.source_shape = (meta['height'], meta['width'])
+        self.has_overviews = meta['has_overviews']
+        self.current_data = data
+        self.current_file = filepath
+        self.auto_range = (data, auto_range)
+        self._redraw()
+    
+    def _load_failed(self, load_id, err):
+        if load_id != self._load_id:
+            return
+        self.progress.stop()
+        messagebox.showerror("Error", f"Failed to display:\n{err}")
+    
+    def _redraw(self, rebuild=True):
+        """Render self.current_data with the current display options (no disk I/O)
+        
+        Artists are created once and updated in place. rebuild=True (a new
+        raster) also resets extent, title and colorbar label.
+        """
+        try:
+            data = self.current_data
+            fname = os.path.basename(self.current_file)
             
             # Detect product type
-            product_type = self.detect_product_type(fname)
+            product_type = self.get_product_type(self.current_file)
             
             # Get colormap
             if self.colormap_var.get() == "auto":
@@ -514,12 +766,10 @@ class ASFInSARViewer:
             
             cmap = self.get_colormap(cmap_name)
             
-            # Calculate display range
-            valid_data = data[np.isfinite(data)]
-            if len(valid_data) > 0:
-                vmin, vmax = np.percentile(valid_data, [2, 98])
-            else:
-                vmin, vmax = 0, 1
+            # Calculate display range (cached per raster for colormap changes)
+            if self.auto_range is None or self.auto_range[0] is not data:
+                self.auto_range = (data, approx_percentiles(data))
+            vmin, vmax = self.auto_range[1]
             
             # User overrides
             if self.vmin_var.get() != "auto":
@@ -533,12 +783,8 @@ class ASFInSARViewer:
                 except:
                     pass
             
-            # Plot
-            self.fig.clear()
-            self.ax = self.fig.add_subplot(111)
-            self.ax.set_facecolor(self.colors['bg_medium'])
-            
-            im = self.ax.imshow(data, cmap=cmap, vmin=vmin, vmax=vmax)
+            # Colormap once to uint8 RGBA
+            rgba = self.to_rgba(data, cmap_name, vmin, vmax)
             
             # Title
             title_map = {
@@ -552,59 +798,84 @@ class ASFInSARViewer:
                 'incidence': 'Incidence Angle',
                 'azimuth': 'Azimuth Angle'
             }
-            
             title = title_map.get(product_type, product_type.upper())
-            self.ax.set_title(title, fontsize=12, color=self.colors['text'], fontweight='bold')
-            self.ax.set_xlabel('Range (pixels)', color=self.colors['text_secondary'])
-            self.ax.set_ylabel('Azimuth (pixels)', color=self.colors['text_secondary'])
-            self.ax.tick_params(colors=self.colors['text_secondary'])
+            height, width = self.source_shape
             
-            # Colorbar
-            cbar_labels = {
-                'wrapped_phase': 'Phase (rad)',
-                'unwrapped_phase': 'Phase (rad)',
-                'coherence': 'Coherence',
-                'amplitude': 'Amplitude',
-                'dem': 'Elevation (m)',
-                'displacement': 'Displacement (m)',
-                'vertical_disp': 'Displacement (m)',
-                'incidence': 'Angle (deg)',
-                'azimuth': 'Angle (deg)'
-            }
+            if self._im is None:
+                # First product: replace the placeholder with image + colorbar
+                self.ax.clear()
+                self.ax.set_facecolor(self.colors['bg_medium'])
+                self._im = self.ax.imshow(rgba)
+                self.ax.set_xlabel('Range (pixels)', color=self.colors['text_secondary'])
+                self.ax.set_ylabel('Azimuth (pixels)', color=self.colors['text_secondary'])
+                self.ax.tick_params(colors=self.colors['text_secondary'])
+                
+                self._mappable = ScalarMappable(norm=Normalize(vmin=vmin, vmax=vmax), cmap=cmap)
+                self._cbar = self.fig.colorbar(self._mappable,
+                                               cax=self.fig.add_axes([0.90, 0.08, 0.025, 0.84]))
+                self._cbar.ax.yaxis.set_tick_params(color=self.colors['text_secondary'])
+            else:
+                # Update artists in place; the colorbar follows the mappable
+                self._im.set_data(rgba)
+                self._mappable.set_cmap(cmap)
+                self._mappable.set_clim(vmin, vmax)
             
-            cbar = self.fig.colorbar(im, ax=self.ax, shrink=0.8)
-            cbar.set_label(cbar_labels.get(product_type, 'Value'), 
-                          color=self.colors['text_secondary'])
-            cbar.ax.yaxis.set_tick_params(color=self.colors['text_secondary'])
+            if rebuild:
+                # New raster: extent in source pixels so axes match the
+                # full-resolution grid
+                self._im.set_extent((-0.5, width - 0.5, height - 0.5, -0.5))
+                self.ax.set_xlim(-0.5, width - 0.5)
+                self.ax.set_ylim(height - 0.5, -0.5)
+                self.ax.set_title(title, fontsize=12, color=self.colors['text'], fontweight='bold')
+                
+                # Colorbar label
+                cbar_labels = {
+                    'wrapped_phase': 'Phase (rad)',
+                    'unwrapped_phase': 'Phase (rad)',
+                    'coherence': 'Coherence',
+                    'amplitude': 'Amplitude',
+                    'dem': 'Elevation (m)',
+                    'displacement': 'Displacement (m)',
+                    'vertical_disp': 'Displacement (m)',
+                    'incidence': 'Angle (deg)',
+                    'azimuth': 'Angle (deg)'
+                }
+                self._cbar.set_label(cbar_labels.get(product_type, 'Value'), 
+                                     color=self.colors['text_secondary'])
+                self.toolbar.update()  # reset zoom history for the new raster
             
-            self.fig.tight_layout()
-            self.canvas.draw()
+            self.canvas.draw_idle()
             
-            self.title_label.config(text=f"{product_type.upper()} | {data.shape[1]}x{data.shape[0]} px")
+            self.title_label.config(text=f"{product_type.upper()} | {width}x{height} px")
             
             # Info
             info_text = f"File: {fname[:30]}...\n" if len(fname) > 30 else f"File: {fname}\n"
             info_text += f"Type: {product_type}\n"
-            info_text += f"Shape: {data.shape}\n"
-            info_text += f"Range: {np.nanmin(data):.4f} to {np.nanmax(data):.4f}\n"
+            info_text += f"Shape: {self.source_shape}\n"
+            if HAS_BOTTLENECK:
+                data_min, data_max = bn.nanmin(data), bn.nanmax(data)
+            else:
+                data_min, data_max = np.nanmin(data), np.nanmax(data)
+            info_text += f"Range: {data_min:.4f} to {data_max:.4f}\n"
             info_text += f"Display: {vmin:.4f} to {vmax:.4f}\n"
             info_text += f"Colormap: {cmap_name}"
             self.update_info(info_text)
             
-            self.status_var.set(f"Displaying: {title}")
+            if data.shape != self.source_shape and not self.has_overviews:
+                self.status_var.set(f"Displaying: {title} (tip: build overviews with gdaladdo for faster loading)")
+            else:
+                self.status_var.set(f"Displaying: {title}")
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to display:\n{str(e)}")
-        finally:
-            self.progress.stop()
     
     def on_colormap_change(self, event=None):
-        if self.current_file:
-            self.display_product(self.current_file)
+        if self.current_data is not None:
+            self._redraw(rebuild=False)
     
     def apply_settings(self):
-        if self.current_file:
-            self.display_product(self.current_file)
+        if self.current_data is not None:
+            self._redraw(rebuild=False)
     
     def save_image(self):
         if self.current_data is None:
@@ -678,24 +949,25 @@ class ASFInSARViewer:
         n = len(selected)
         fig = Figure(figsize=(14, 6), facecolor=self.colors['bg_dark'])
         
-        for i, (path, _) in enumerate(selected):
+        # Decode in parallel (GDAL releases the GIL), decimated to one
+        # subplot's share of the figure; plot on the main thread
+        target = (int(fig.get_figheight() * fig.dpi), int(fig.get_figwidth() * fig.dpi / n))
+        with ThreadPoolExecutor(max_workers=n) as executor:
+            futures = [executor.submit(self.read_geotiff, path, target) for path, _ in selected]
+        
+        for i, ((path, _), future) in enumerate(zip(selected, futures)):
             ax = fig.add_subplot(1, n, i+1)
             ax.set_facecolor(self.colors['bg_medium'])
             
             try:
-                data = self.read_geotiff(path)
+                data, _ = future.result()
                 if len(data.shape) == 3:
                     data = data[0]
                 
-                fname = os.path.basename(path)
-                product_type = self.detect_product_type(fname)
+                product_type = self.get_product_type(path)
                 cmap = self.get_colormap(self.get_default_colormap(product_type))
                 
-                valid_data = data[np.isfinite(data)]
-                if len(valid_data) > 0:
-                    vmin, vmax = np.percentile(valid_data, [2, 98])
-                else:
-                    vmin, vmax = 0, 1
+                vmin, vmax = approx_percentiles(data)
                 
                 ax.imshow(data, cmap=cmap, vmin=vmin, vmax=vmax)
                 ax.set_title(product_type.upper(), fontsize=10, 
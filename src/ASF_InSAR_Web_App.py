@@ -14,20 +14,33 @@ Version: 1.1
 import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.colors import LinearSegmentedColormap
+from matplotlib.cm import ScalarMappable
+from matplotlib.colors import LinearSegmentedColormap, Normalize, to_hex
+from matplotlib.figure import Figure
 import plotly.graph_objects as go
+import functools
 import os
-import tempfile
+import re
+import warnings
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 
 # Try to import rasterio
 try:
-    import rasterio
+    from rasterio.enums import Resampling
+    from rasterio.io import MemoryFile
     HAS_RASTERIO = True
 except ImportError:
     HAS_RASTERIO = False
 
+# Kernels live in a helper module so they compile once, not on every rerun
+try:
+    from _scan_kernels import scan_stats, scan_hist
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 # Page configuration
 st.set_page_config(
     page_title="ASF InSAR Viewer",
@@ -71,8 +84,9 @@ st.markdown("""
 
 
 # Custom colormaps
+@st.cache_resource(show_spinner=False)
 def create_insar_colormaps():
-    """Create custom colormaps for InSAR products"""
+    """Create custom colormaps for InSAR products (shared across sessions and reruns)"""
     cmaps = {}
     phase_colors = ['#ff0000', '#ffff00', '#00ff00', '#00ffff', '#0000ff', '#ff00ff', '#ff0000']
     cmaps['phase'] = LinearSegmentedColormap.from_list('phase', phase_colors, N=256)
@@ -84,26 +98,43 @@ def create_insar_colormaps():
 
 CUSTOM_CMAPS = create_insar_colormaps()
 
+# Largest heatmap dimension shipped to the browser
+PLOTLY_MAX_DIM = 1500
+
+# GDAL releases the GIL while decoding, so decode several files at once
+MAX_DECODE_WORKERS = 8
+
+# Largest dimension read for display; full resolution is read on demand
+DISPLAY_MAX_DIM = 2048
+
+# Histogram bins behind the fused-scan percentiles
+STATS_BINS = 4096
 
+# Auto-range percentiles are estimated from this many sampled pixels
+PERCENTILE_SAMPLE = 100_000
+
+
+PRODUCT_PATTERNS = {
+    'wrapped_phase': ['wrapped_phase', 'phase_wrapped', 'wrapped'],
+    'unwrapped_phase': ['unwrapped_phase', 'phase_unwrapped', 'unwrapped', 'unw'],
+    'coherence': ['corr', 'coherence', 'coh'],
+    'amplitude': ['amp', 'amplitude'],
+    'dem': ['dem', 'elevation', 'height'],
+    'displacement': ['displacement', 'disp', 'los'],
+    'vertical_disp': ['vert', 'vertical'],
+    'incidence': ['inc', 'incidence', 'lv_theta'],
+    'azimuth': ['lv_phi', 'azimuth']
+}
+PRODUCT_REGEX = re.compile('|'.join(
+    f"(?P<{product_type}>{'|'.join(map(re.escape, keywords))})"
+    for product_type, keywords in PRODUCT_PATTERNS.items()))
+
+
+@functools.lru_cache(maxsize=512)
 def detect_product_type(filename):
     """Detect InSAR product type from filename"""
-    fname_lower = filename.lower()
-    patterns = {
-        'wrapped_phase': ['wrapped_phase', 'phase_wrapped', 'wrapped'],
-        'unwrapped_phase': ['unwrapped_phase', 'phase_unwrapped', 'unwrapped', 'unw'],
-        'coherence': ['corr', 'coherence', 'coh'],
-        'amplitude': ['amp', 'amplitude'],
-        'dem': ['dem', 'elevation', 'height'],
-        'displacement': ['displacement', 'disp', 'los'],
-        'vertical_disp': ['vert', 'vertical'],
-        'incidence': ['inc', 'incidence', 'lv_theta'],
-        'azimuth': ['lv_phi', 'azimuth']
-    }
-    for product_type, keywords in patterns.items():
-        for keyword in keywords:
-            if keyword in fname_lower:
-                return product_type
-    return 'unknown'
+    match = PRODUCT_REGEX.search(filename.lower())
+    return match.lastgroup if match else 'unknown'
 
 
 def get_default_colormap(product_type):
@@ -133,91 +164,271 @@ def get_colormap(name):
         return plt.get_cmap('viridis')
 
 
-def read_geotiff(file_bytes, filename):
-    """Read GeoTIFF from uploaded bytes"""
+# Streamlit re-executes this script on every rerun, which would reset an
+# lru_cache; cache_resource keeps these tables for the server's lifetime
+@st.cache_resource(max_entries=32, show_spinner=False)
+def get_lut(name):
+    """(256, 4) uint8 RGBA lookup table for a colormap"""
+    return (get_colormap(name)(np.linspace(0, 1, 256)) * 255).round().astype(np.uint8)
+
+
+def to_rgba(data, cmap_name, vmin, vmax):
+    """Colormap data through the uint8 LUT; non-finite pixels become transparent"""
+    span = vmax - vmin if vmax > vmin else 1.0
+    norm = (data - np.float32(vmin)) * np.float32(256.0 / span)
+    finite = np.isfinite(norm)
+    norm[~finite] = 0
+    np.clip(norm, 0, 255, out=norm)
+    rgba = get_lut(cmap_name)[norm.astype(np.uint8)]
+    rgba[~finite, 3] = 0
+    return rgba
+
+
+def _read_band(src, out_shape=None, mask_nodata=True):
+    """Read band 1 as float32 with nodata as NaN; integer rasters without nodata keep their dtype"""
+    nodata = src.nodata
+    if out_shape is not None:
+        # Averaged, decimated read; served from overviews when the file has them
+        data = src.read(1, out_shape=out_shape, resampling=Resampling.average,
+                        out_dtype='float32', masked=True)
+        return data.filled(np.nan)
+    if np.issubdtype(np.dtype(src.dtypes[0]), np.integer):
+        data = src.read(1)
+        if nodata is None:
+            return data
+        # Compare on the narrow integer buffer before widening
+        mask = data == nodata
+        data = data.astype(np.float32)
+        data[mask] = np.nan
+        return data
+    data = src.read(1, out_dtype='float32')
+    if mask_nodata and nodata is not None and not np.isnan(nodata):
+        data[data == np.float32(nodata)] = np.nan
+    return data
+
+
+def _fused_stats(data, nodata):
+    """Nodata masking and statistics in two parallel passes over data"""
+    flat = data.reshape(-1)
+    if nodata is None:
+        nodata = np.nan
+    dmin, dmax, total, count = scan_stats(flat, flat.dtype.type(nodata))
+    if count == 0:
+        return None
+    if dmax > dmin:
+        cdf = np.cumsum(scan_hist(flat, dmin, dmax, STATS_BINS))
+        width = (dmax - dmin) / STATS_BINS
+        p2, p98 = (dmin + (np.searchsorted(cdf, q * count) + 0.5) * width for q in (0.02, 0.98))
+    else:
+        p2 = p98 = dmin
+    return {
+        'min': float(dmin),
+        'max': float(dmax),
+        'mean': float(total / count),
+        'p2': float(p2),
+        'p98': float(p98)
+    }
+
+
+def _display_shape(src, max_dim):
+    """Decimation factor and output shape keeping max(shape) <= max_dim"""
+    if max_dim is None:
+        return 1, None
+    scale = max(1, -(-max(src.width, src.height) // max_dim))
+    if scale == 1:
+        return 1, None
+    return scale, (src.height // scale, src.width // scale)
+
+
+def _read_display(src, max_dim):
+    """Band 1 decimated by _display_shape, plus precomputed stats where cheap"""
+    scale, out_shape = _display_shape(src, max_dim)
+    # With numba the fused scan does the float nodata substitution
+    data = _read_band(src, out_shape=out_shape, mask_nodata=not HAS_NUMBA)
+    if HAS_NUMBA and data.dtype == np.float32:
+        nodata = src.nodata if out_shape is None else None
+        return data, scale, _fused_stats(data, nodata)
+    return data, scale, None
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def read_geotiff(file_bytes, filename, max_dim=DISPLAY_MAX_DIM):
+    """Read GeoTIFF from uploaded bytes (cached on file content across reruns)"""
+    return _read_geotiff(file_bytes, max_dim)
+
+
+def _read_geotiff(file_bytes, max_dim=DISPLAY_MAX_DIM):
+    """Uncached read_geotiff, for one-off full-resolution reads and worker threads"""
     if not HAS_RASTERIO:
         return None, None, "Rasterio not installed"
     
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.tif') as tmp:
-        tmp.write(file_bytes)
-        tmp_path = tmp.name
-    
     try:
-        with rasterio.open(tmp_path) as src:
-            data = src.read(1).astype(np.float64)
-            nodata = src.nodata
+        with MemoryFile(file_bytes) as memfile, memfile.open() as src:
+            data, scale, stats = _read_display(src, max_dim)
             meta = {
                 'crs': str(src.crs) if src.crs else 'Unknown',
                 'transform': src.transform,
                 'width': src.width,
                 'height': src.height,
-                'bounds': src.bounds
+                'bounds': src.bounds,
+                'scale': scale
             }
-            if nodata is not None:
-                data = np.where(data == nodata, np.nan, data)
+            if stats is not None:
+                meta['stats'] = stats
             return data, meta, None
     except Exception as e:
         return None, None, str(e)
-    finally:
-        os.unlink(tmp_path)
 
 
+def _decode_member(entry, max_dim=DISPLAY_MAX_DIM):
+    """Decode one (name, bytes) ZIP member; runs in a worker thread"""
+    name, file_bytes = entry
+    try:
+        with MemoryFile(file_bytes) as memfile, memfile.open() as src:
+            data, scale, stats = _read_display(src, max_dim)
+            info = {
+                'data': data,
+                'crs': str(src.crs) if src.crs else 'Unknown',
+                'shape': (src.height, src.width),
+                'scale': scale,
+                'bytes': file_bytes
+            }
+            if stats is not None:
+                info['stats'] = stats
+            return name, info, None
+    except Exception as e:
+        return name, None, e
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
 def extract_zip(zip_bytes):
-    """Extract TIF files from uploaded ZIP"""
+    """Extract TIF files from uploaded ZIP (cached on archive content)"""
     tif_files = {}
     
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        zip_path = os.path.join(tmp_dir, 'upload.zip')
-        with open(zip_path, 'wb') as f:
-            f.write(zip_bytes)
-        
-        with zipfile.ZipFile(zip_path, 'r') as zf:
-            for name in zf.namelist():
-                if name.lower().endswith(('.tif', '.tiff')):
-                    zf.extract(name, tmp_dir)
-                    extracted_path = os.path.join(tmp_dir, name)
-                    try:
-                        with rasterio.open(extracted_path) as src:
-                            data = src.read(1).astype(np.float64)
-                            nodata = src.nodata
-                            if nodata is not None:
-                                data = np.where(data == nodata, np.nan, data)
-                            tif_files[os.path.basename(name)] = {
-                                'data': data,
-                                'crs': str(src.crs) if src.crs else 'Unknown',
-                                'shape': data.shape
-                            }
-                    except Exception as e:
-                        st.warning(f"Could not read {name}: {e}")
-    return tif_files
-
-
-def create_matplotlib_figure(data, title, cmap_name, vmin, vmax):
-    """Create matplotlib figure for display"""
-    fig, ax = plt.subplots(figsize=(10, 8))
-    fig.patch.set_facecolor('#1a1a2e')
-    ax.set_facecolor('#16213e')
+    with zipfile.ZipFile(BytesIO(zip_bytes)) as zf:
+        entries = [(name, zf.read(name)) for name in zf.namelist()
+                   if name.lower().endswith(('.tif', '.tiff'))]
     
-    cmap = get_colormap(cmap_name)
-    im = ax.imshow(data, cmap=cmap, vmin=vmin, vmax=vmax)
+    if not entries:
+        return tif_files
     
-    ax.set_title(title, fontsize=14, color='white', fontweight='bold')
-    ax.set_xlabel('Range (pixels)', color='#a0a0a0')
-    ax.set_ylabel('Azimuth (pixels)', color='#a0a0a0')
-    ax.tick_params(colors='#a0a0a0')
+    with ThreadPoolExecutor(max_workers=min(MAX_DECODE_WORKERS, len(entries))) as ex:
+        results = list(ex.map(_decode_member, entries))
     
-    cbar = fig.colorbar(im, ax=ax, shrink=0.8)
-    cbar.ax.yaxis.set_tick_params(color='#a0a0a0')
-    plt.setp(plt.getp(cbar.ax.axes, 'yticklabels'), color='#a0a0a0')
+    # Streamlit calls must stay on the script thread
+    for name, info, error in results:
+        if error is not None:
+            st.warning(f"Could not read {name}: {error}")
+        else:
+            tif_files[os.path.basename(name)] = info
+    return tif_files
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def read_geotiffs(uploads):
+    """read_geotiff for (bytes, name) uploads, decoded concurrently (cached on content)"""
+    # Workers run the uncached reader; only this script-thread call touches the cache
+    with ThreadPoolExecutor(max_workers=min(MAX_DECODE_WORKERS, len(uploads))) as ex:
+        return list(ex.map(lambda upload: _read_geotiff(upload[0]), uploads))
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _compute_stats(data):
+    """Summary statistics of the finite pixels in data"""
+    valid_data = data[np.isfinite(data)]
+    if len(valid_data) == 0:
+        return None
+    # valid_data has no NaN, so plain reductions suffice
+    sample = valid_data
+    if valid_data.size > PERCENTILE_SAMPLE:
+        # Fixed seed keeps the display range stable across reruns
+        idx = np.random.default_rng(0).integers(0, valid_data.size, size=PERCENTILE_SAMPLE)
+        sample = valid_data[idx]
+    p2, p98 = np.percentile(sample, [2, 98])
+    return {
+        'min': float(valid_data.min()),
+        'max': float(valid_data.max()),
+        'mean': float(valid_data.mean(dtype=np.float64)),
+        'p2': float(p2),
+        'p98': float(p98)
+    }
+
+
+def create_matplotlib_figure(data, title, cmap_name, vmin, vmax, scale=1):
+    """Matplotlib figure for display, built once per session and updated in place
+
+    scale is the number of source pixels per data pixel.
+    """
+    h, w = data.shape
+    rgba = to_rgba(data, cmap_name, vmin, vmax)
+    extent = (-0.5, w * scale - 0.5, h * scale - 0.5, -0.5)
     
-    plt.tight_layout()
-    return fig
+    handles = st.session_state.get('_mpl_figure')
+    if handles is None:
+        # A bare Figure is not tracked by pyplot, so it goes away with the session
+        fig = Figure(figsize=(10, 8))
+        ax = fig.subplots()
+        fig.patch.set_facecolor('#1a1a2e')
+        ax.set_facecolor('#16213e')
+        
+        im = ax.imshow(rgba, extent=extent)
+        
+        ax.set_title(title, fontsize=14, color='white', fontweight='bold')
+        ax.set_xlabel('Range (pixels)', color='#a0a0a0')
+        ax.set_ylabel('Azimuth (pixels)', color='#a0a0a0')
+        ax.tick_params(colors='#a0a0a0')
+        
+        mappable = ScalarMappable(norm=Normalize(vmin=vmin, vmax=vmax), cmap=get_colormap(cmap_name))
+        cbar = fig.colorbar(mappable, ax=ax, shrink=0.8)
+        cbar.ax.yaxis.set_tick_params(color='#a0a0a0', labelcolor='#a0a0a0')
+        
+        fig.tight_layout()
+        handles = {'fig': fig, 'ax': ax, 'im': im, 'mappable': mappable}
+        st.session_state['_mpl_figure'] = handles
+    else:
+        handles['im'].set_data(rgba)
+        handles['im'].set_extent(extent)
+        handles['ax'].set_title(title, fontsize=14, color='white', fontweight='bold')
+        # The colorbar follows its mappable through the 'changed' callback
+        handles['mappable'].set_cmap(get_colormap(cmap_name))
+        handles['mappable'].set_clim(vmin, vmax)
+    return handles['fig']
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _render_png(data, title, cmap_name, vmin, vmax, scale=1):
+    """Render the matplotlib figure once to PNG bytes"""
+    fig = create_matplotlib_figure(data, title, cmap_name, vmin, vmax, scale)
+    buf = st.session_state.setdefault('_png_buffer', BytesIO())
+    buf.seek(0)
+    buf.truncate()
+    fig.savefig(buf, format='png', dpi=300, bbox_inches='tight', facecolor='#1a1a2e')
+    return buf.getvalue()
 
 
-def create_plotly_figure(data, title, colorscale, vmin, vmax):
-    """Create interactive Plotly figure - FIXED VERSION"""
+def block_mean(data, step):
+    """Downsample data by averaging step x step blocks, ignoring NaN"""
+    if step <= 1:
+        return data
+    h, w = data.shape[0] // step * step, data.shape[1] // step * step
+    blocks = data[:h, :w].reshape(h // step, step, w // step, step)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        return np.nanmean(blocks, axis=(1, 3), dtype=np.float32)
+
+
+def create_plotly_figure(data, title, colorscale, vmin, vmax, scale=1):
+    """Create interactive Plotly figure, decimated to PLOTLY_MAX_DIM"""
+    step = max(1, -(-max(data.shape) // PLOTLY_MAX_DIM))
+    z = block_mean(data, step).astype(np.float32, copy=False)
+    # Keep axes in source pixel coordinates
+    cell = step * scale
     fig = go.Figure(data=go.Heatmap(
-        z=data,
+        z=z,
+        x0=(cell - 1) / 2,
+        dx=cell,
+        y0=(cell - 1) / 2,
+        dy=cell,
         colorscale=colorscale,
         zmin=vmin,
         zmax=vmax,
@@ -267,10 +478,21 @@ PLOTLY_COLORSCALES = {
     'terrain': 'Earth',
     'coherence': 'Greys'
 }
+PLOTLY_STOPS = 32
+
 
+@st.cache_resource(max_entries=32, show_spinner=False)
+def get_plotly_colorscale(cmap_name, n=PLOTLY_STOPS):
+    """Plotly colorscale for cmap_name; custom colormaps are sampled to n stops"""
+    if cmap_name in CUSTOM_CMAPS:
+        cmap = CUSTOM_CMAPS[cmap_name]
+        return [[i / (n - 1), to_hex(cmap(i / (n - 1)))] for i in range(n)]
+    return PLOTLY_COLORSCALES.get(cmap_name, 'Viridis')
 
-def process_and_display(data, filename, meta, selected_cmap, auto_range, manual_vmin, manual_vmax, viz_type):
-    """Process and display the data"""
+
+def process_and_display(data, filename, meta, selected_cmap, auto_range, manual_vmin, manual_vmax, viz_type,
+                        source_bytes=None):
+    """Process and display the data; source_bytes is the original GeoTIFF for exports"""
     
     product_type = detect_product_type(filename)
     
@@ -279,15 +501,16 @@ def process_and_display(data, filename, meta, selected_cmap, auto_range, manual_
     else:
         cmap_name = selected_cmap
     
-    valid_data = data[np.isfinite(data)]
-    if len(valid_data) > 0:
+    stats = meta['stats'] if 'stats' in meta else _compute_stats(data)
+    if stats is not None:
         if auto_range:
-            vmin, vmax = np.percentile(valid_data, [2, 98])
+            vmin, vmax = stats['p2'], stats['p98']
         else:
-            vmin = manual_vmin if manual_vmin is not None else np.nanmin(data)
-            vmax = manual_vmax if manual_vmax is not None else np.nanmax(data)
+            vmin = manual_vmin if manual_vmin is not None else stats['min']
+            vmax = manual_vmax if manual_vmax is not None else stats['max']
     else:
         vmin, vmax = 0, 1
+        stats = {'min': np.nan, 'max': np.nan, 'mean': np.nan}
     
     title_map = {
         'wrapped_phase': 'Wrapped Interferometric Phase',
@@ -301,24 +524,26 @@ def process_and_display(data, filename, meta, selected_cmap, auto_range, manual_
         'azimuth': 'Azimuth Angle'
     }
     title = title_map.get(product_type, filename)
+    scale = meta.get('scale', 1)
+    width = meta.get('width', data.shape[1])
+    height = meta.get('height', data.shape[0])
     
     col1, col2, col3, col4 = st.columns(4)
     with col1:
         st.metric("Product Type", product_type.upper())
     with col2:
-        st.metric("Dimensions", f"{data.shape[1]} × {data.shape[0]}")
+        st.metric("Dimensions", f"{width} × {height}")
     with col3:
-        st.metric("Min Value", f"{np.nanmin(data):.4f}")
+        st.metric("Min Value", f"{stats['min']:.4f}")
     with col4:
-        st.metric("Max Value", f"{np.nanmax(data):.4f}")
+        st.metric("Max Value", f"{stats['max']:.4f}")
     
     if viz_type == "Interactive (Plotly)":
-        plotly_cmap = PLOTLY_COLORSCALES.get(cmap_name, 'Viridis')
-        fig = create_plotly_figure(data, title, plotly_cmap, vmin, vmax)
+        plotly_cmap = get_plotly_colorscale(cmap_name)
+        fig = create_plotly_figure(data, title, plotly_cmap, vmin, vmax, scale)
         st.plotly_chart(fig, use_container_width=True)
     else:
-        fig = create_matplotlib_figure(data, title, cmap_name, vmin, vmax)
-        st.pyplot(fig)
+        st.image(_render_png(data, title, cmap_name, vmin, vmax, scale))
     
     with st.expander("📋 Detailed Information"):
         st.markdown(f"""
@@ -326,44 +551,59 @@ def process_and_display(data, filename, meta, selected_cmap, auto_range, manual_
         |----------|-------|
         | **Filename** | {filename} |
         | **Product Type** | {product_type} |
-        | **Width** | {data.shape[1]} pixels |
-        | **Height** | {data.shape[0]} pixels |
+        | **Width** | {width} pixels |
+        | **Height** | {height} pixels |
         | **CRS** | {meta.get('crs', 'Unknown')} |
-        | **Data Min** | {np.nanmin(data):.6f} |
-        | **Data Max** | {np.nanmax(data):.6f} |
-        | **Data Mean** | {np.nanmean(data):.6f} |
+        | **Data Min** | {stats['min']:.6f} |
+        | **Data Max** | {stats['max']:.6f} |
+        | **Data Mean** | {stats['mean']:.6f} |
         | **Display Range** | {vmin:.4f} to {vmax:.4f} |
         | **Colormap** | {cmap_name} |
         """)
     
     st.markdown("---")
-    col1, col2 = st.columns(2)
+    col1, col2, col3 = st.columns(3)
     
     with col1:
-        fig_dl = create_matplotlib_figure(data, title, cmap_name, vmin, vmax)
-        buf = BytesIO()
-        fig_dl.savefig(buf, format='png', dpi=300, bbox_inches='tight', facecolor='#1a1a2e')
-        buf.seek(0)
-        plt.close(fig_dl)
-        
-        st.download_button(
-            label="📥 Download PNG",
-            data=buf,
-            file_name=f"{product_type}_{filename.replace('.tif', '')}.png",
-            mime="image/png"
-        )
+        # The static view has already rendered the PNG; the Plotly view renders it on request
+        if viz_type != "Interactive (Plotly)" or st.button("🖼️ Prepare PNG"):
+            st.download_button(
+                label="📥 Download PNG",
+                data=_render_png(data, title, cmap_name, vmin, vmax, scale),
+                file_name=f"{product_type}_{filename.replace('.tif', '')}.png",
+                mime="image/png"
+            )
     
     with col2:
-        csv_buf = BytesIO()
-        np.savetxt(csv_buf, data, delimiter=',', fmt='%.6f')
-        csv_buf.seek(0)
-        
-        st.download_button(
-            label="📥 Download CSV Data",
-            data=csv_buf.getvalue(),
-            file_name=f"{product_type}_{filename.replace('.tif', '')}.csv",
-            mime="text/csv"
-        )
+        if source_bytes is not None:
+            st.download_button(
+                label="📥 Download GeoTIFF",
+                data=source_bytes,
+                file_name=os.path.basename(filename),
+                mime="image/tiff"
+            )
+    
+    with col3:
+        # Full-resolution array as binary .npy; read only on request
+        if st.button("📄 Prepare NumPy Data"):
+            with st.spinner("Reading full resolution..."):
+                full_data, error = data, None
+                if source_bytes is not None:
+                    # Uncached: one export shouldn't pin a full-resolution raster
+                    full_data, _, error = _read_geotiff(source_bytes, max_dim=None)
+                if error is None:
+                    npy_buf = BytesIO()
+                    np.save(npy_buf, full_data.astype(np.float32, copy=False))
+            
+            if error is not None:
+                st.error(f"Could not read full resolution: {error}")
+            else:
+                st.download_button(
+                    label="📥 Download .npy Data",
+                    data=npy_buf.getvalue(),
+                    file_name=f"{product_type}_{filename.replace('.tif', '')}.npy",
+                    mime="application/octet-stream"
+                )
 
 
 def main():
@@ -410,35 +650,42 @@ def main():
             )
         
         st.markdown("---")
-        st.markdown("## 🎨 Display Options")
-        
-        colormap_options = [
-            "auto", "phase", "displacement", "terrain", "coherence",
-            "viridis", "plasma", "inferno", "magma", "gray",
-            "jet", "hsv", "RdBu_r", "seismic"
-        ]
-        selected_cmap = st.selectbox("Colormap", colormap_options, index=0)
-        
-        st.markdown("### Value Range")
-        auto_range = st.checkbox("Auto range (2-98 percentile)", value=True)
         
-        manual_vmin = None
-        manual_vmax = None
-        if not auto_range:
+        # Display settings only rerun the app when applied
+        with st.form("display_opts"):
+            st.markdown("## 🎨 Display Options")
+            
+            colormap_options = [
+                "auto", "phase", "displacement", "terrain", "coherence",
+                "viridis", "plasma", "inferno", "magma", "gray",
+                "jet", "hsv", "RdBu_r", "seismic"
+            ]
+            selected_cmap = st.selectbox("Colormap", colormap_options, index=0)
+            
+            st.markdown("### Value Range")
+            auto_range = st.checkbox("Auto range (2-98 percentile)", value=True)
+            
             col1, col2 = st.columns(2)
             with col1:
-                manual_vmin = st.number_input("Min", value=0.0)
+                vmin_input = st.number_input("Min", value=0.0)
             with col2:
-                manual_vmax = st.number_input("Max", value=1.0)
-        
-        st.markdown("---")
-        st.markdown("## 📊 Visualization")
+                vmax_input = st.number_input("Max", value=1.0)
+            
+            st.markdown("---")
+            st.markdown("## 📊 Visualization")
+            
+            viz_type = st.radio(
+                "Plot type:",
+                ["Interactive (Plotly)", "Static (Matplotlib)"],
+                index=0
+            )
+            
+            st.form_submit_button("Apply")
         
-        viz_type = st.radio(
-            "Plot type:",
-            ["Interactive (Plotly)", "Static (Matplotlib)"],
-            index=0
-        )
+        manual_vmin = None
+        manual_vmax = None
+        if not auto_range:
+            manual_vmin, manual_vmax = vmin_input, vmax_input
         
         st.markdown("---")
         st.markdown("### ℹ️ About")
@@ -455,7 +702,8 @@ def main():
     # Main content
     if upload_type == "Single GeoTIFF" and uploaded_file is not None:
         with st.spinner("Loading GeoTIFF..."):
-            data, meta, error = read_geotiff(uploaded_file.read(), uploaded_file.name)
+            file_bytes = uploaded_file.read()
+            data, meta, error = read_geotiff(file_bytes, uploaded_file.name)
         
         if error:
             st.error(f"Error reading file: {error}")
@@ -465,7 +713,8 @@ def main():
             process_and_display(
                 data, uploaded_file.name, meta, 
                 selected_cmap, auto_range, 
-                manual_vmin, manual_vmax, viz_type
+                manual_vmin, manual_vmax, viz_type,
+                source_bytes=file_bytes
             )
     
     elif upload_type == "ZIP Archive" and uploaded_file is not None:
@@ -486,12 +735,16 @@ def main():
         
         if selected_file:
             file_info = tif_files[selected_file]
-            meta = {'crs': file_info['crs'], 'width': file_info['shape'][1], 'height': file_info['shape'][0]}
+            meta = {'crs': file_info['crs'], 'width': file_info['shape'][1], 'height': file_info['shape'][0],
+                    'scale': file_info['scale']}
+            if 'stats' in file_info:
+                meta['stats'] = file_info['stats']
             
             process_and_display(
                 file_info['data'], selected_file, meta,
                 selected_cmap, auto_range,
-                manual_vmin, manual_vmax, viz_type
+                manual_vmin, manual_vmax, viz_type,
+                source_bytes=file_info['bytes']
             )
         
         # Comparison view
@@ -511,12 +764,13 @@ def main():
                 data1 = tif_files[compare1]['data']
                 pt1 = detect_product_type(compare1)
                 cmap1 = get_default_colormap(pt1) if selected_cmap == "auto" else selected_cmap
-                vmin1, vmax1 = np.nanpercentile(data1, [2, 98])
+                stats1 = _compute_stats(data1) or {'p2': 0, 'p98': 1}
+                vmin1, vmax1 = stats1['p2'], stats1['p98']
                 
                 fig1 = create_plotly_figure(
                     data1, pt1.upper(),
-                    PLOTLY_COLORSCALES.get(cmap1, 'Viridis'),
-                    vmin1, vmax1
+                    get_plotly_colorscale(cmap1),
+                    vmin1, vmax1, tif_files[compare1]['scale']
                 )
                 st.plotly_chart(fig1, use_container_width=True)
             
@@ -524,12 +778,13 @@ def main():
                 data2 = tif_files[compare2]['data']
                 pt2 = detect_product_type(compare2)
                 cmap2 = get_default_colormap(pt2) if selected_cmap == "auto" else selected_cmap
-                vmin2, vmax2 = np.nanpercentile(data2, [2, 98])
+                stats2 = _compute_stats(data2) or {'p2': 0, 'p98': 1}
+                vmin2, vmax2 = stats2['p2'], stats2['p98']
                 
                 fig2 = create_plotly_figure(
                     data2, pt2.upper(),
-                    PLOTLY_COLORSCALES.get(cmap2, 'Viridis'),
-                    vmin2, vmax2
+                    get_plotly_colorscale(cmap2),
+                    vmin2, vmax2, tif_files[compare2]['scale']
                 )
                 st.plotly_chart(fig2, use_container_width=True)
     
@@ -537,10 +792,13 @@ def main():
         st.success(f"✅ Uploaded {len(uploaded_file)} files")
         
         tif_data = {}
-        for f in uploaded_file:
-            data, meta, error = read_geotiff(f.read(), f.name)
+        uploads = tuple((f.read(), f.name) for f in uploaded_file)
+        results = read_geotiffs(uploads)
+        for (file_bytes, name), (data, meta, error) in zip(uploads, results):
             if data is not None:
-                tif_data[f.name] = {'data': data, 'meta': meta}
+                tif_data[name] = {'data': data, 'meta': meta, 'bytes': file_bytes}
+            else:
+                st.warning(f"Could not read {name}: {error}")
         
         if tif_data:
             selected_file = st.selectbox(
@@ -554,7 +812,8 @@ def main():
                 process_and_display(
                     file_info['data'], selected_file, file_info['meta'],
                     selected_cmap, auto_range,
-                    manual_vmin, manual_vmax, viz_type
+                    manual_vmin, manual_vmax, viz_type,
+                    source_bytes=file_info['bytes']
                 )
     
     else:
@@ -6,10 +6,99 @@ matplotlib.use('TkAgg')
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 from matplotlib.figure import Figure
-from matplotlib.colors import LinearSegmentedColormap
+from matplotlib.colors import LinearSegmentedColormap, ListedColormap, Normalize, NoNorm
+from matplotlib.cm import ScalarMappable
+import math
 import os
+from collections import OrderedDict
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 import h5py
 
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Raw data chunk cache: the 1 MiB default is smaller than a single compressed
+# chunk in many InSAR products, which forces a re-decompress on every read
+CHUNK_CACHE_BYTES = 256 * 1024 * 1024
+CHUNK_CACHE_SLOTS = 1_000_003
+CHUNK_CACHE_W0 = 0.75
+# Chunk count above which the chunk index is walked at open time
+CHUNK_WARM_THRESHOLD = 10_000
+# Wait for the toolbar to settle before re-reading a zoomed region
+REFINE_DELAY_MS = 150
+# GeoTIFF export: tiled and DEFLATE-compressed, with the float predictor
+GEOTIFF_BLOCK = 256
+GEOTIFF_OPTIONS = ['TILED=YES', f'BLOCKXSIZE={GEOTIFF_BLOCK}', f'BLOCKYSIZE={GEOTIFF_BLOCK}',
+                   'COMPRESS=DEFLATE', 'PREDICTOR=3', 'NUM_THREADS=ALL_CPUS', 'BIGTIFF=IF_SAFER']
+# Decoded datasets kept for instant re-selection
+DISPLAY_CACHE_SIZE = 4
+# Display images are uint8 colormap codes; this one marks non-finite pixels
+NODATA_CODE = 255
+# Histogram resolution for the 2-98 % display stretch
+PERCENTILE_BINS = 1024
+
+try:
+    from numpy._core._multiarray_umath import __cpu_features__
+except ImportError:
+    try:
+        from numpy.core._multiarray_umath import __cpu_features__
+    except ImportError:
+        __cpu_features__ = {}
+
+# NumPy's AVX-512 (SVML) arctan2 outruns a scalar-atan2 Numba loop even across
+# many cores, so the jitted phase kernel is only used without it
+USE_NUMBA_PHASE = HAS_NUMBA and not __cpu_features__.get('AVX512_SKX', False)
+
+if HAS_NUMBA:
+    # fastmath without nnan/ninf so NaN samples stay NaN
+    @njit(parallel=True, fastmath={'nsz', 'arcp', 'contract', 'afn', 'reassoc'}, cache=True)
+    def _phase_f32(z, out):
+        """Phase of a 2-D complex array into a float32 buffer, rows in parallel"""
+        for i in prange(z.shape[0]):
+            for j in range(z.shape[1]):
+                c = z[i, j]
+                out[i, j] = math.atan2(c.imag, c.real)
+    
+    SCAN_CHUNKS = 64
+    
+    @njit(parallel=True, cache=True)
+    def _scan_range(flat):
+        """Replace non-finite values with NaN in place while tracking min/max/count"""
+        n = flat.size
+        step = (n + SCAN_CHUNKS - 1) // SCAN_CHUNKS
+        mins = np.full(SCAN_CHUNKS, np.inf)
+        maxs = np.full(SCAN_CHUNKS, -np.inf)
+        counts = np.zeros(SCAN_CHUNKS, np.int64)
+        for c in prange(SCAN_CHUNKS):
+            for i in range(c * step, min(n, (c + 1) * step)):
+                x = flat[i]
+                if np.isfinite(x):
+                    mins[c] = min(mins[c], x)
+                    maxs[c] = max(maxs[c], x)
+                    counts[c] += 1
+                else:
+                    flat[i] = np.nan
+        return mins.min(), maxs.max(), counts.sum()
+    
+    @njit(parallel=True, cache=True)
+    def _scan_hist(flat, lo, hi, bins):
+        """Histogram of finite values over [lo, hi]; one row per chunk avoids races"""
+        n = flat.size
+        step = (n + SCAN_CHUNKS - 1) // SCAN_CHUNKS
+        hist = np.zeros((SCAN_CHUNKS, bins), np.int64)
+        scale = bins / (hi - lo)
+        for c in prange(SCAN_CHUNKS):
+            for i in range(c * step, min(n, (c + 1) * step)):
+                x = flat[i]
+                if np.isfinite(x):
+                    k = min(int((x - lo) * scale), bins - 1)
+                    hist[c, k] += 1
+        return hist.sum(axis=0)
+
 class InSARViewerApp:
     def __init__(self, root):
         self.root = root
@@ -39,9 +128,34 @@ class InSARViewerApp:
         self.hdf5_file = None
         self.datasets = {}
         self.current_data = None
+        self.current_ds_name = None
+        self.current_im = None
+        self.current_region = None
+        self.current_style = None
+        self.current_view = None
+        self.current_auto = None
+        self.current_info = None
+        self.cbar_mappable = None
+        self.cbar = None
+        self._background = None
+        self._refine_job = None
+        self._display_request = 0
+        self._file_generation = 0
+        # Decoded display arrays, keyed on (file generation, dataset, canvas shape),
+        # least recent first
+        self._display_cache = OrderedDict()
+        # (data, vmin, vmax, codes) of the last quantize
+        self._codes = None
+        # One I/O thread: h5py calls stay serialized, the Tk loop stays free
+        self._io_executor = ThreadPoolExecutor(max_workers=1)
         self.dataset_list = []
         
+        self._info_shown = None
         self.custom_cmaps = self.create_insar_colormaps()
+        self._lut_cache = {}
+        # Scratch buffers are shared by the Tk thread and the I/O worker
+        self._scratch = {}
+        self._scratch_lock = threading.Lock()
         
         self.setup_styles()
         self.create_widgets()
@@ -62,7 +176,41 @@ class InSARViewerApp:
         else:
             return plt.get_cmap(name)
     
+    def get_display_cmap(self, name):
+        """Colormap indexed directly by quantize() codes; the last entry is transparent"""
+        cmap = self._lut_cache.get(name)
+        if cmap is None:
+            colors = self.get_colormap(name)(np.linspace(0, 1, NODATA_CODE))
+            cmap = ListedColormap(np.vstack([colors, (0, 0, 0, 0)]), name=f"{name}_u8")
+            self._lut_cache[name] = cmap
+        return cmap
+    
+    def scratch(self, key, shape, dtype):
+        """Reusable buffer for short-lived arrays, grown on demand"""
+        dtype = np.dtype(dtype)
+        nbytes = int(np.prod(shape)) * dtype.itemsize
+        with self._scratch_lock:
+            buf = self._scratch.get(key)
+            if buf is None or buf.nbytes < nbytes:
+                buf = np.empty(nbytes, dtype=np.uint8)
+                self._scratch[key] = buf
+        return buf[:nbytes].view(dtype).reshape(shape)
+    
+    def quantize(self, data, vmin, vmax):
+        """uint8 codes 0-254 spanning [vmin, vmax]; non-finite pixels get NODATA_CODE"""
+        span = vmax - vmin if vmax > vmin else 1.0
+        norm = self.scratch('norm', data.shape, np.float32)
+        np.subtract(data, np.float32(vmin), out=norm)
+        norm *= np.float32(NODATA_CODE / span)
+        finite = np.isfinite(norm)
+        norm[~finite] = 0
+        np.clip(norm, 0, NODATA_CODE - 1, out=norm)
+        codes = norm.astype(np.uint8)
+        codes[~finite] = NODATA_CODE
+        return codes
+    
     def on_closing(self):
+        self._io_executor.shutdown(wait=True)
         if self.hdf5_file:
             self.hdf5_file.close()
         self.root.destroy()
@@ -132,7 +280,9 @@ class InSARViewerApp:
         list_frame.pack(fill=tk.X)
         scrollbar = tk.Scrollbar(list_frame)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.dataset_listbox = tk.Listbox(list_frame, height=8, bg=self.colors['bg_light'], fg=self.colors['text'], selectbackground=self.colors['accent'], selectforeground=self.colors['text'], relief=tk.FLAT, font=('Consolas', 9), yscrollcommand=scrollbar.set)
+        # Backed by a Tcl list: replacing the contents is a single call
+        self.dataset_names = tk.Variable(value=[])
+        self.dataset_listbox = tk.Listbox(list_frame, listvariable=self.dataset_names, height=8, bg=self.colors['bg_light'], fg=self.colors['text'], selectbackground=self.colors['accent'], selectforeground=self.colors['text'], relief=tk.FLAT, font=('Consolas', 9), yscrollcommand=scrollbar.set)
         self.dataset_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         self.dataset_listbox.bind('<<ListboxSelect>>', self.on_dataset_select)
         scrollbar.config(command=self.dataset_listbox.yview)
@@ -205,6 +355,9 @@ class InSARViewerApp:
         self.toolbar.update()
     
     def update_info(self, text):
+        if text == self._info_shown:
+            return
+        self._info_shown = text
         self.info_text.config(state=tk.NORMAL)
         self.info_text.delete(1.0, tk.END)
         self.info_text.insert(tk.END, text)
@@ -226,41 +379,209 @@ class InSARViewerApp:
             messagebox.showerror("Error", f"File not found: {filepath}")
             return
         
+        self.progress.start(10)
+        self.status_var.set("⏳ Loading HDF5 file...")
+        # The old file is closed on the worker; stop new selections from reaching it
+        self.dataset_names.set([])
+        self.dataset_list = []
+        self._file_generation += 1
+        self._display_request += 1
+        # h5py releases the GIL while reading, so the Tk loop keeps running
+        future = self._io_executor.submit(self._open_file, filepath)
+        future.add_done_callback(lambda f: self.root.after(0, self._on_loaded, f, filepath))
+    
+    def _open_file(self, filepath):
+        """Worker: open filepath and enumerate its datasets"""
+        if self.hdf5_file:
+            self.hdf5_file.close()
+        hdf5_file, datasets = self.open_hdf5(filepath)
+        largest = self.largest_chunk_bytes(datasets)
+        if largest > CHUNK_CACHE_BYTES:
+            # Make sure at least one full chunk fits in the cache
+            hdf5_file.close()
+            hdf5_file, datasets = self.open_hdf5(filepath, largest)
+        self.warm_chunk_index(datasets)
+        return hdf5_file, datasets
+    
+    def _on_loaded(self, future, filepath):
+        self.progress.stop()
         try:
-            self.progress.start(10)
-            self.status_var.set("⏳ Loading HDF5 file...")
-            
-            if self.hdf5_file:
-                self.hdf5_file.close()
-            
-            self.hdf5_file = h5py.File(filepath, 'r')
-            self.datasets = {}
-            self.dataset_list = []
-            self.find_datasets(self.hdf5_file, "")
-            
-            self.dataset_listbox.delete(0, tk.END)
-            for ds_name in self.dataset_list:
-                self.dataset_listbox.insert(tk.END, ds_name)
-            
-            info_text = f"File: {os.path.basename(filepath)}\nDatasets: {len(self.dataset_list)}\n\nSelect a dataset to visualize."
-            self.update_info(info_text)
-            self.status_var.set(f"✓ Loaded! Found {len(self.dataset_list)} datasets.")
-            
+            self.hdf5_file, self.datasets = future.result()
         except Exception as e:
+            self.hdf5_file, self.datasets = None, {}
             messagebox.showerror("Error", f"Failed to load file:\n{str(e)}")
-        finally:
-            self.progress.stop()
-    
-    def find_datasets(self, group, path):
-        for key in group.keys():
-            item = group[key]
-            item_path = f"{path}/{key}" if path else key
-            if isinstance(item, h5py.Dataset):
-                if len(item.shape) >= 2:
-                    self.dataset_list.append(item_path)
-                    self.datasets[item_path] = item
-            elif isinstance(item, h5py.Group):
-                self.find_datasets(item, item_path)
+            return
+        self.dataset_list = list(self.datasets)
+        self._display_cache.clear()
+        self.current_data = None
+        self.current_ds_name = None
+        
+        self.dataset_names.set(self.dataset_list)
+        
+        info_text = f"File: {os.path.basename(filepath)}\nDatasets: {len(self.dataset_list)}\n\nSelect a dataset to visualize."
+        self.update_info(info_text)
+        self.status_var.set(f"✓ Loaded! Found {len(self.dataset_list)} datasets.")
+    
+    def open_hdf5(self, filepath, cache_bytes=CHUNK_CACHE_BYTES):
+        hdf5_file = h5py.File(filepath, 'r', rdcc_nbytes=cache_bytes, rdcc_nslots=CHUNK_CACHE_SLOTS, rdcc_w0=CHUNK_CACHE_W0)
+        return hdf5_file, self.find_datasets(hdf5_file)
+    
+    def largest_chunk_bytes(self, datasets):
+        sizes = [int(np.prod(ds.chunks)) * ds.dtype.itemsize for ds in datasets.values() if ds.chunks]
+        return max(sizes, default=0)
+    
+    def warm_chunk_index(self, datasets):
+        """Walk the chunk index of heavily chunked datasets once, up front
+        
+        Loads the B-tree nodes into the metadata cache while the file opens
+        instead of on the first slices. Needs h5py >= 3.8 with HDF5 >= 1.12.3.
+        """
+        for ds in datasets.values():
+            if ds.chunks is None:
+                continue
+            n_chunks = np.prod([-(-n // c) for n, c in zip(ds.shape, ds.chunks)])
+            if n_chunks < CHUNK_WARM_THRESHOLD:
+                continue
+            try:
+                ds.id.chunk_iter(lambda info: None)
+            except (AttributeError, RuntimeError, NotImplementedError):
+                # Older h5py/HDF5 without H5Dchunk_iter
+                return
+    
+    def find_datasets(self, group):
+        """All datasets with at least two dimensions, keyed by path"""
+        datasets = {}
+        def _visit(name, obj):
+            if isinstance(obj, h5py.Dataset) and obj.ndim >= 2:
+                datasets[name] = obj
+        group.visititems(_visit)
+        return datasets
+    
+    def get_display_shape(self):
+        """Canvas size in pixels as (height, width)"""
+        widget = self.canvas.get_tk_widget()
+        width, height = widget.winfo_width(), widget.winfo_height()
+        if width <= 1 or height <= 1:
+            # Not mapped yet; fall back to the figure size
+            width, height = self.fig.get_size_inches() * self.fig.dpi
+        return int(height), int(width)
+    
+    def image_axes(self, ds):
+        axes = [i for i, n in enumerate(ds.shape) if n != 1][-2:]
+        if len(axes) < 2:
+            axes = [ds.ndim - 2, ds.ndim - 1]
+        return axes
+    
+    def read_slice(self, ds, out_shape=None, region=None):
+        """Read a 2-D slice of ds, strided down to roughly out_shape
+        
+        The image axes are the last two axes longer than 1; every other axis
+        is read at index 0. region limits the read to (row0, row1, col0, col1)
+        on the image axes. One step is used for both axes to keep the aspect
+        ratio. Returns (data, step, sliced); complex data comes back in a
+        shared scratch buffer and must be converted before the next read.
+        """
+        shape = ds.shape
+        axes = self.image_axes(ds)
+        if region is None:
+            region = (0, shape[axes[0]], 0, shape[axes[1]])
+        bounds = {axes[0]: region[0:2], axes[1]: region[2:4]}
+        step = 1
+        if out_shape is not None:
+            step = max(1, max((bounds[a][1] - bounds[a][0]) // n for a, n in zip(axes, out_shape)))
+        index = tuple(slice(*bounds[i], step) if i in axes else 0 for i in range(ds.ndim))
+        sliced = any(shape[i] != 1 for i in range(ds.ndim) if i not in axes)
+        
+        mm = self.memmap_dataset(ds)
+        if mm is not None:
+            # Zero-copy view; the OS page cache serves repeated slicing
+            return mm[index], step, sliced
+        
+        if ds.dtype.kind == 'c':
+            # Complex samples only live until to_display turns them into phase
+            data = self.scratch('complex', tuple(len(range(*index[a].indices(shape[a]))) for a in axes), ds.dtype)
+            ds.read_direct(data, source_sel=index)
+            return data, step, sliced
+        
+        full = all(bounds[a] == (0, shape[a]) for a in axes)
+        if ds.ndim == 2 and step == 1 and full:
+            try:
+                # Bulk copy straight into a preallocated array
+                data = np.empty(shape, dtype=ds.dtype)
+                ds.read_direct(data)
+                return data, step, sliced
+            except Exception:
+                pass
+        # Hyperslab selection: only the selected rows/columns are read
+        return ds[index], step, sliced
+    
+    def memmap_dataset(self, ds):
+        """Map an uncompressed contiguous dataset straight from the file, or None"""
+        if ds.chunks is not None or ds.external or ds.is_virtual or ds.dtype.hasobject:
+            return None
+        if ds.id.get_create_plist().get_layout() != h5py.h5d.CONTIGUOUS:
+            return None
+        offset = ds.id.get_offset()
+        if offset is None:
+            # Storage not allocated yet (never written)
+            return None
+        try:
+            return np.memmap(ds.file.filename, dtype=ds.dtype, mode='r', offset=offset, shape=ds.shape)
+        except (OSError, ValueError):
+            return None
+    
+    def to_display(self, data):
+        """Convert a raw slice to a float array for imshow; returns (data, data_type)"""
+        # Handle complex data; float32 is plenty for an 8-bit display
+        if np.iscomplexobj(data):
+            phase = np.empty(data.shape, dtype=np.float32)
+            if USE_NUMBA_PHASE:
+                _phase_f32(data, phase)
+            else:
+                np.arctan2(data.imag, data.real, out=phase)
+            return phase, "Phase (Complex)"
+        if data.dtype not in (np.float32, np.float64):
+            data = data.astype(np.float32, copy=False)
+        elif not data.flags.writeable or not data.dtype.isnative:
+            # Memory-mapped view; the display pipeline works in place
+            data = data.astype(data.dtype.newbyteorder('='))
+        return data, "Real"
+    
+    def percentile_range(self, data, percentiles=(2, 98)):
+        """Approximate percentiles of the finite values from a histogram
+        
+        Non-finite values in data are replaced with NaN in place.
+        """
+        if HAS_NUMBA and data.flags.c_contiguous:
+            # Two fused passes: min/max + NaN fill, then the histogram
+            flat = data.reshape(-1)
+            lo, hi, count = _scan_range(flat)
+            if count == 0:
+                return 0, 1
+            if lo == hi:
+                return float(lo), float(hi)
+            counts = _scan_hist(flat, lo, hi, PERCENTILE_BINS)
+            edges = np.linspace(lo, hi, PERCENTILE_BINS + 1)
+        else:
+            counts, edges = self._numpy_histogram(data)
+            if counts is None:
+                return edges
+        cdf = np.concatenate(([0], np.cumsum(counts)))
+        vmin, vmax = np.interp(np.asarray(percentiles) / 100 * cdf[-1], cdf, edges)
+        return float(vmin), float(vmax)
+    
+    def _numpy_histogram(self, data):
+        """NumPy fallback for percentile_range; (None, range) when there is nothing to bin"""
+        finite = np.isfinite(data)
+        if not finite.any():
+            return None, (0, 1)
+        if not finite.all():
+            np.copyto(data, np.nan, where=~finite)
+        lo, hi = np.nanmin(data), np.nanmax(data)
+        if lo == hi:
+            return None, (float(lo), float(hi))
+        # NaNs fall outside the explicit range and are ignored
+        return np.histogram(data, bins=PERCENTILE_BINS, range=(lo, hi))
     
     def on_dataset_select(self, event):
         selection = self.dataset_listbox.curselection()
@@ -269,84 +590,214 @@ class InSARViewerApp:
             self.display_dataset(ds_name)
     
     def display_dataset(self, ds_name):
+        self.progress.start(10)
+        self.status_var.set(f"⏳ Loading {ds_name}...")
+        self._display_request += 1
+        request = self._display_request
+        key = (self._file_generation, ds_name, self.get_display_shape())
+        cached = self._display_cache.get(key)
+        if cached is not None:
+            # Already decoded at this size: skip the read and the percentile pass
+            self._display_cache.move_to_end(key)
+            future = Future()
+            future.set_result(cached)
+            self._refresh_canvas(future, request)
+            return
+        future = self._io_executor.submit(self._load_display, *key[1:])
+        future.add_done_callback(lambda f: self.root.after(0, self._refresh_canvas, f, request, key))
+    
+    def _load_display(self, ds_name, out_shape):
+        """Worker: read and prepare ds_name for display"""
+        ds = self.datasets[ds_name]
+        data, step, sliced = self.read_slice(ds, out_shape)
+        data, data_type = self.to_display(data)
+        if sliced:
+            data_type += " (slice)"
+        vmin, vmax = self.percentile_range(data)
+        return ds_name, data, data_type, step, vmin, vmax
+    
+    def _refresh_canvas(self, future, request, key=None):
+        self.progress.stop()
+        if key is not None and future.exception() is None:
+            self._display_cache[key] = future.result()
+            while len(self._display_cache) > DISPLAY_CACHE_SIZE:
+                self._display_cache.popitem(last=False)
+        if request != self._display_request:
+            # A newer selection is already on its way
+            return
         try:
-            self.progress.start(10)
-            self.status_var.set(f"⏳ Loading {ds_name}...")
-            
-            ds = self.datasets[ds_name]
-            data = ds[:]
-            original_shape = data.shape
-            
-            # Handle complex data
-            if np.iscomplexobj(data):
-                data = np.angle(data)
-                data_type = "Phase (Complex)"
-            else:
-                data = data.astype(np.float64)
-                data_type = "Real"
-            
-            # Squeeze out dimensions of size 1 (handles shapes like (1, 40, 40, 1))
-            data = np.squeeze(data)
-            
-            # If still more than 2D, take first slice
-            while len(data.shape) > 2:
-                data = data[0]
-                data_type += " (slice)"
-            
+            ds_name, data, data_type, step, vmin, vmax = future.result()
             self.current_data = data
-            
-            # Clear and plot
+            self.current_ds_name = ds_name
+            self.current_auto = (vmin, vmax)
+            self.current_info = (data_type, step)
+            # (array, row0, col0, step) currently drawn by the image artist
+            self.current_view = (data, 0, 0, step)
+            self.current_region = None
+            self.render(new_dataset=True)
+            self.status_var.set(f"✓ Displaying: {ds_name}")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to display dataset:\n{str(e)}")
+    
+    def display_limits(self):
+        vmin, vmax = self.current_auto
+        if self.vmin_var.get() != "auto":
+            try: vmin = float(self.vmin_var.get())
+            except: pass
+        if self.vmax_var.get() != "auto":
+            try: vmax = float(self.vmax_var.get())
+            except: pass
+        return vmin, vmax
+    
+    def render(self, new_dataset=False):
+        """Draw current_view, updating the existing artists in place when there are any"""
+        data, row0, col0, step = self.current_view
+        cmap_name = self.colormap_var.get()
+        vmin, vmax = self.display_limits()
+        if self._codes is not None and self._codes[0] is data and self._codes[1:3] == (vmin, vmax):
+            # Colormap-only change: the codes don't depend on the colormap
+            codes = self._codes[3]
+        else:
+            codes = self.quantize(data, vmin, vmax)
+            self._codes = (data, vmin, vmax, codes)
+        display_cmap = self.get_display_cmap(cmap_name)
+        # Style-only changes leave the axes frame, ticks and labels untouched
+        blit = not new_dataset and self._background is not None
+        self.current_style = (cmap_name, vmin, vmax)
+        
+        if self.current_im is None:
             self.fig.clear()
             self.ax = self.fig.add_subplot(111)
             self.ax.set_facecolor(self.colors['bg_medium'])
-            
-            cmap = self.get_colormap(self.colormap_var.get())
-            
-            valid_data = self.current_data[np.isfinite(self.current_data)]
-            if len(valid_data) > 0:
-                vmin, vmax = np.percentile(valid_data, [2, 98])
-            else:
-                vmin, vmax = 0, 1
-            
-            if self.vmin_var.get() != "auto":
-                try: vmin = float(self.vmin_var.get())
-                except: pass
-            if self.vmax_var.get() != "auto":
-                try: vmax = float(self.vmax_var.get())
-                except: pass
-            
-            im = self.ax.imshow(self.current_data, cmap=cmap, vmin=vmin, vmax=vmax)
-            self.ax.set_title(f"📊 {ds_name}", fontsize=12, color=self.colors['text'], fontweight='bold')
+            # NoNorm: the uint8 codes index the colormap directly; colors are
+            # resampled (not codes) so cyclic maps don't blend across the wrap
+            self.current_im = self.ax.imshow(codes, cmap=display_cmap, norm=NoNorm(), interpolation_stage='rgba')
+            # The image holds codes, not values; the colorbar gets its own mappable
+            self.cbar_mappable = ScalarMappable(norm=Normalize(vmin, vmax), cmap=self.get_colormap(cmap_name))
             self.ax.set_xlabel('Range (pixels)', color=self.colors['text_secondary'])
             self.ax.set_ylabel('Azimuth (pixels)', color=self.colors['text_secondary'])
             self.ax.tick_params(colors=self.colors['text_secondary'])
             
-            cbar = self.fig.colorbar(im, ax=self.ax, shrink=0.8)
-            cbar.ax.yaxis.set_tick_params(color=self.colors['text_secondary'])
-            
+            self.cbar = self.fig.colorbar(self.cbar_mappable, ax=self.ax, shrink=0.8)
+            self.cbar.ax.yaxis.set_tick_params(color=self.colors['text_secondary'])
+            # Full draws skip animated artists, so on_draw can snapshot the background
+            self.set_animated(True)
+            self.canvas.mpl_connect('draw_event', self.on_draw)
+            # Re-read the visible region when the toolbar zooms or pans
+            self.ax.callbacks.connect('xlim_changed', self.on_view_changed)
+            self.ax.callbacks.connect('ylim_changed', self.on_view_changed)
+        else:
+            self.current_im.set_data(codes)
+            self.current_im.set_cmap(display_cmap)
+            self.cbar_mappable.set_cmap(self.get_colormap(cmap_name))
+            self.cbar_mappable.set_clim(vmin, vmax)
+        
+        if new_dataset:
+            # Axes stay in source pixel coordinates when the read was decimated
+            rows, cols = data.shape
+            extent = (-0.5, cols * step - 0.5, rows * step - 0.5, -0.5)
+            self.current_im.set_extent(extent)
+            self.ax.set_xlim(extent[0], extent[1], emit=False)
+            self.ax.set_ylim(extent[2], extent[3], emit=False)
+            self.ax.set_title(f"📊 {self.current_ds_name}", fontsize=12, color=self.colors['text'], fontweight='bold')
+            # Forget the previous dataset's zoom history
+            self.toolbar.update()
             self.fig.tight_layout()
-            self.canvas.draw()
-            
-            info_text = f"Dataset: {ds_name}\nOriginal Shape: {original_shape}\nDisplay Shape: {self.current_data.shape}\nType: {ds.dtype}\nData: {data_type}\nMin: {vmin:.4f}\nMax: {vmax:.4f}"
-            self.update_info(info_text)
-            self.status_var.set(f"✓ Displaying: {ds_name}")
-            
+        
+        if blit:
+            self.canvas.restore_region(self._background)
+            self.draw_animated()
+            self.canvas.blit(self.fig.bbox)
+        else:
+            self.canvas.draw_idle()
+        
+        ds = self.datasets[self.current_ds_name]
+        data_type, step = self.current_info
+        display_shape = f"{self.current_data.shape}"
+        if step > 1:
+            display_shape += f" (1/{step})"
+        info_text = f"Dataset: {self.current_ds_name}\nOriginal Shape: {ds.shape}\nDisplay Shape: {display_shape}\nType: {ds.dtype}\nData: {data_type}\nMin: {vmin:.4f}\nMax: {vmax:.4f}"
+        self.update_info(info_text)
+    
+    def on_draw(self, event):
+        """After a full draw: keep the background for blitting, then add the animated artists"""
+        if self.current_im is None or self.canvas.is_saving():
+            return
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self.draw_animated()
+    
+    def set_animated(self, animated):
+        self.current_im.set_animated(animated)
+        self.cbar.ax.set_animated(animated)
+    
+    def draw_animated(self):
+        self.ax.draw_artist(self.current_im)
+        self.fig.draw_artist(self.cbar.ax)
+    
+    def on_view_changed(self, ax):
+        # Debounce: only the view the toolbar settles on gets re-read
+        if self._refine_job is not None:
+            self.root.after_cancel(self._refine_job)
+        self._refine_job = self.root.after(REFINE_DELAY_MS, self.refine_view)
+    
+    def refine_view(self):
+        """Redraw the visible region from the file at screen resolution"""
+        self._refine_job = None
+        if self.current_ds_name is None:
+            return
+        ds = self.datasets[self.current_ds_name]
+        axes = self.image_axes(ds)
+        height, width = ds.shape[axes[0]], ds.shape[axes[1]]
+        (x0, x1), (y0, y1) = sorted(self.ax.get_xlim()), sorted(self.ax.get_ylim())
+        col0, col1 = max(0, int(np.floor(x0 + 0.5))), min(width, int(np.ceil(x1 + 0.5)))
+        row0, row1 = max(0, int(np.floor(y0 + 0.5))), min(height, int(np.ceil(y1 + 0.5)))
+        if row1 <= row0 or col1 <= col0:
+            return
+        region = (row0, row1, col0, col1)
+        if region == (0, height, 0, width):
+            region = None
+        if region == self.current_region:
+            return
+        # The unshrunk axes box; ax.bbox lags behind until the aspect is reapplied on draw
+        box = self.ax.get_position(original=True).transformed(self.fig.transFigure)
+        target = (max(1, int(box.height)), max(1, int(box.width)))
+        self.current_region = region
+        request = self._display_request
+        future = self._io_executor.submit(self._load_region, ds, target, region)
+        future.add_done_callback(lambda f: self.root.after(0, self._apply_region, f, request, region))
+    
+    def _load_region(self, ds, out_shape, region):
+        """Worker: read region of ds for the zoomed view"""
+        data, step, _ = self.read_slice(ds, out_shape, region)
+        return self.to_display(data)[0], step
+    
+    def _apply_region(self, future, request, region):
+        if request != self._display_request or region != self.current_region:
+            return
+        try:
+            data, step = future.result()
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to display dataset:\n{str(e)}")
-        finally:
-            self.progress.stop()
+            self.status_var.set(f"⚠ Could not refine view: {e}")
+            return
+        row0, col0 = (region or (0, 0, 0, 0))[0::2]
+        rows, cols = data.shape
+        xlim, ylim = self.ax.get_xlim(), self.ax.get_ylim()
+        self.current_view = (data, row0, col0, step)
+        self.current_im.set_data(self.quantize(data, *self.current_style[1:]))
+        self.current_im.set_extent((col0 - 0.5, col0 + cols * step - 0.5, row0 + rows * step - 0.5, row0 - 0.5))
+        # set_extent may autoscale; keep the user's view
+        self.ax.set_xlim(xlim, emit=False)
+        self.ax.set_ylim(ylim, emit=False)
+        self.canvas.draw_idle()
     
     def update_colormap(self, event=None):
+        # Style-only changes recolor the data already on screen
         if self.current_data is not None:
-            selection = self.dataset_listbox.curselection()
-            if selection:
-                self.display_dataset(self.dataset_list[selection[0]])
+            self.render()
     
     def apply_settings(self):
         if self.current_data is not None:
-            selection = self.dataset_listbox.curselection()
-            if selection:
-                self.display_dataset(self.dataset_list[selection[0]])
+            self.render()
     
     def save_image(self):
         if self.current_data is None:
@@ -355,7 +806,14 @@ class InSARViewerApp:
         save_path = filedialog.asksaveasfilename(title="Save Image", defaultextension=".png", filetypes=[("PNG files", "*.png"), ("PDF files", "*.pdf")])
         if save_path:
             try:
-                self.fig.savefig(save_path, dpi=300, bbox_inches='tight', facecolor=self.colors['bg_dark'])
+                # savefig skips animated artists
+                if self.current_im is not None:
+                    self.set_animated(False)
+                try:
+                    self.fig.savefig(save_path, dpi=300, bbox_inches='tight', facecolor=self.colors['bg_dark'])
+                finally:
+                    if self.current_im is not None:
+                        self.set_animated(True)
                 messagebox.showinfo("Success", f"Image saved to:\n{save_path}")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to save: {str(e)}")
@@ -366,19 +824,43 @@ class InSARViewerApp:
             return
         try:
             from osgeo import gdal
-            save_path = filedialog.asksaveasfilename(title="Export GeoTIFF", defaultextension=".tif", filetypes=[("GeoTIFF files", "*.tif *.tiff")])
-            if save_path:
-                driver = gdal.GetDriverByName('GTiff')
-                rows, cols = self.current_data.shape
-                out_ds = driver.Create(save_path, cols, rows, 1, gdal.GDT_Float32)
-                out_ds.GetRasterBand(1).WriteArray(self.current_data)
-                out_ds = None
-                messagebox.showinfo("Success", f"GeoTIFF exported to:\n{save_path}")
         except ImportError:
             messagebox.showwarning("Warning", "GDAL not available. Use 'Save' for PNG instead.")
+            return
+        save_path = filedialog.asksaveasfilename(title="Export GeoTIFF", defaultextension=".tif", filetypes=[("GeoTIFF files", "*.tif *.tiff")])
+        if save_path:
+            self.progress.start(10)
+            self.status_var.set(f"⏳ Exporting {os.path.basename(save_path)}...")
+            future = self._io_executor.submit(self._write_geotiff, gdal, self.datasets[self.current_ds_name], save_path)
+            future.add_done_callback(lambda f: self.root.after(0, self._on_exported, f, save_path))
+    
+    def _write_geotiff(self, gdal, ds, save_path):
+        """Worker: stream ds at full resolution into a tiled, DEFLATE-compressed GeoTIFF"""
+        axes = self.image_axes(ds)
+        rows, cols = ds.shape[axes[0]], ds.shape[axes[1]]
+        driver = gdal.GetDriverByName('GTiff')
+        out_ds = driver.Create(save_path, cols, rows, 1, gdal.GDT_Float32, options=GEOTIFF_OPTIONS)
+        if out_ds is None:
+            raise RuntimeError(gdal.GetLastErrorMsg() or "could not create file")
+        band = out_ds.GetRasterBand(1)
+        # One row of tiles at a time keeps memory flat for any dataset size
+        for row0 in range(0, rows, GEOTIFF_BLOCK):
+            row1 = min(rows, row0 + GEOTIFF_BLOCK)
+            strip, _, _ = self.read_slice(ds, region=(row0, row1, 0, cols))
+            strip, _ = self.to_display(strip)
+            band.WriteArray(strip, 0, row0)
+        band.FlushCache()
+        out_ds = None
+    
+    def _on_exported(self, future, save_path):
+        self.progress.stop()
+        try:
+            future.result()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to export: {str(e)}")
-
+            return
+        self.status_var.set(f"✓ Exported: {os.path.basename(save_path)}")
+        messagebox.showinfo("Success", f"GeoTIFF exported to:\n{save_path}")
 
 if __name__ == "__main__":
     root = tk.Tk()
@@ -14,19 +14,34 @@ import numpy as np
 import matplotlib
 matplotlib.use('TkAgg')
 import matplotlib.pyplot as plt
+plt.style.use('dark_background')
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 from matplotlib.figure import Figure
-from matplotlib.colors import LinearSegmentedColormap
+from matplotlib.colors import LinearSegmentedColormap, Normalize
+from matplotlib.cm import ScalarMappable
 from matplotlib.patches import Rectangle, Circle
+from matplotlib.collections import PatchCollection
 import os
-import glob
 import json
+import multiprocessing
+import copy
+import csv
+import hashlib
+import heapq
+import atexit
+import shutil
+import tempfile
 from datetime import datetime, date
+from functools import lru_cache
+from urllib.parse import urlsplit
 import re
 import threading
 import subprocess
+import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 import xml.etree.ElementTree as ET
-from queue import Queue
+from queue import Queue, Empty
 
 # Try to import required libraries
 try:
@@ -61,10 +76,244 @@ except ImportError:
 
 try:
     import asf_search as asf
+    import requests
+    from requests.adapters import HTTPAdapter
+    from requests.exceptions import RequestException
+    from urllib3.util.retry import Retry
     HAS_ASF = True
 except ImportError:
     HAS_ASF = False
 
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+if HAS_NUMBA:
+    @njit(parallel=True, cache=True)
+    def _coherence_mask(data, coh, threshold, out):
+        """Copy data into out, NaN where coherence is below threshold"""
+        for i in prange(data.shape[0]):
+            for j in range(data.shape[1]):
+                out[i, j] = data[i, j] if coh[i, j] >= threshold else np.nan
+
+    SCAN_CHUNKS = 64
+
+    @njit(parallel=True, cache=True)
+    def _finite_range(data):
+        """Min/max/count of the finite values of a 2-D array, row chunks in parallel"""
+        rows = data.shape[0]
+        step = (rows + SCAN_CHUNKS - 1) // SCAN_CHUNKS
+        mins = np.full(SCAN_CHUNKS, np.inf)
+        maxs = np.full(SCAN_CHUNKS, -np.inf)
+        counts = np.zeros(SCAN_CHUNKS, np.int64)
+        for c in prange(SCAN_CHUNKS):
+            for i in range(c * step, min(rows, (c + 1) * step)):
+                for j in range(data.shape[1]):
+                    x = data[i, j]
+                    if np.isfinite(x):
+                        mins[c] = min(mins[c], x)
+                        maxs[c] = max(maxs[c], x)
+                        counts[c] += 1
+        return mins.min(), maxs.max(), counts.sum()
+
+    @njit(parallel=True, cache=True)
+    def _finite_hist(data, lo, hi, bins):
+        """Histogram of the finite values over [lo, hi]; one row per chunk avoids races"""
+        rows = data.shape[0]
+        step = (rows + SCAN_CHUNKS - 1) // SCAN_CHUNKS
+        hist = np.zeros((SCAN_CHUNKS, bins), np.int64)
+        scale = bins / (hi - lo)
+        for c in prange(SCAN_CHUNKS):
+            for i in range(c * step, min(rows, (c + 1) * step)):
+                for j in range(data.shape[1]):
+                    x = data[i, j]
+                    if np.isfinite(x):
+                        k = min(int((x - lo) * scale), bins - 1)
+                        hist[c, k] += 1
+        return hist.sum(axis=0)
+
+# ASF product names carry the pair as S1AA_20150817T223551_20150829T223551_...
+DATE_PAIR_PATTERN = re.compile(r'(\d{8})T\d{6}_(\d{8})T\d{6}')
+
+# Large GDAL block cache and swath so tiled scenes decode each tile once
+GDAL_CACHE_MB = 1024
+GDAL_SWATH_BYTES = 256 * 1024 * 1024
+# Compressed tiles of one file are also decoded in parallel (GDAL >= 3.6)
+GDAL_NUM_THREADS = 'ALL_CPUS'
+if HAS_GDAL:
+    gdal.SetConfigOption('GDAL_CACHEMAX', str(GDAL_CACHE_MB))
+    gdal.SetConfigOption('GDAL_SWATH_SIZE', str(GDAL_SWATH_BYTES))
+    gdal.SetConfigOption('GDAL_NUM_THREADS', GDAL_NUM_THREADS)
+
+# Rasters are held as float32 throughout: sub-millimetre displacement needs
+# ~7 significant digits, and half the bytes per pixel of float64
+RASTER_DTYPE = np.float32
+
+# Wait for pan/zoom to settle before redrawing the visible part at full detail
+REFINE_DELAY_MS = 150
+# Coherence slider drags are coalesced into one re-mask after this quiet period
+COHERENCE_DEBOUNCE_MS = 100
+# Histogram resolution for the 2-98 % display stretch
+PERCENTILE_BINS = 1024
+# GeoTIFF export: tiled and DEFLATE-compressed, with the float predictor
+GEOTIFF_BLOCK = 256
+GEOTIFF_OPTIONS = ['TILED=YES', f'BLOCKXSIZE={GEOTIFF_BLOCK}', f'BLOCKYSIZE={GEOTIFF_BLOCK}',
+                   'COMPRESS=DEFLATE', 'PREDICTOR=3', 'NUM_THREADS=ALL_CPUS', 'BIGTIFF=IF_SAFER']
+
+# GDAL and rasterio release the GIL while decoding, so files load in parallel
+READ_WORKERS = min(8, os.cpu_count() or 1)
+# SLC downloads are network bound; this many scenes are fetched at once by default
+PARALLEL_DOWNLOADS = 4
+MAX_PARALLEL_DOWNLOADS = 8
+# Transient gateway errors are retried with backoff on the shared download session
+DOWNLOAD_RETRIES = 5
+# Worker threads queue status/progress; the UI applies only the latest this often
+UI_POLL_MS = 100
+# Each scene is fetched as byte ranges over several connections, resumable per range
+RANGE_STREAMS = 8
+RANGE_CHUNK_BYTES = 32 << 20
+# Range streams write straight into one shared descriptor where the OS has pwrite
+HAS_PWRITE = hasattr(os, 'pwrite')
+
+# topsApp.py steps, in run order, and the status shown once each starts
+ISCE2_STEPS = {
+    'runPreprocessor': "ISCE2: Preprocessing...",
+    'runTopo': "ISCE2: Computing topography...",
+    'runBurstIfg': "ISCE2: Creating interferograms...",
+    'runMergeBursts': "ISCE2: Merging bursts...",
+    'runFilter': "ISCE2: Filtering...",
+    'runUnwrap': "ISCE2: Unwrapping phase...",
+    'runGeocode': "ISCE2: Geocoding...",
+}
+# One regex pass over new topsApp.log bytes finds any of the step names
+ISCE2_STEP_PATTERN = re.compile(b'|'.join(re.escape(step.encode()) for step in ISCE2_STEPS))
+ISCE2_LOG_POLL_S = 0.2  # How often the worker reads new topsApp.log output
+# topsApp.xml skeleton, parsed once; _generate_isce2_config fills in the leaves
+TOPSAPP_TEMPLATE = ET.fromstring('''<topsApp>
+    <component name="topsinsar">
+        <property name="Sensor name">SENTINEL1</property>
+
+        <component name="reference">
+            <property name="safe"></property>
+            <property name="output directory">reference</property>
+        </component>
+
+        <component name="secondary">
+            <property name="safe"></property>
+            <property name="output directory">secondary</property>
+        </component>
+
+        <property name="do unwrap">True</property>
+        <property name="unwrapper name">snaphu_mcf</property>
+
+        <property name="do ESD">True</property>
+
+        <property name="range looks">7</property>
+        <property name="azimuth looks">2</property>
+        <property name="filter strength">0.5</property>
+
+        <property name="geocode bounding box"></property>
+
+    </component>
+</topsApp>''')
+
+# Displacement colormap (blue=uplift, red=subsidence), shared by all windows
+DISPLACEMENT_CMAP = LinearSegmentedColormap.from_list('displacement', [
+    '#0000ff', '#4444ff', '#8888ff', '#ccccff',
+    '#ffffff',
+    '#ffcccc', '#ff8888', '#ff4444', '#ff0000'
+], N=256)
+
+
+def build_lut(cmap):
+    """RGBA uint8 lookup table for a colormap, with a transparent entry for NaN"""
+    lut = np.empty((cmap.N + 1, 4), dtype=np.uint8)
+    lut[:-1] = np.round(cmap(np.arange(cmap.N)) * 255)
+    lut[-1] = 0
+    lut.flags.writeable = False
+    return lut
+
+
+DISPLACEMENT_LUT = build_lut(DISPLACEMENT_CMAP)
+
+
+@lru_cache(maxsize=8)
+def parse_bbox(lat_min, lat_max, lon_min, lon_max):
+    """AOI entry strings as a float tuple; raises ValueError if any is not numeric"""
+    return float(lat_min), float(lat_max), float(lon_min), float(lon_max)
+
+
+@lru_cache(maxsize=16)
+def _read_safe_manifest(path, mtime_ns):
+    """Parsed manifest.safe of a SAFE zip or directory; mtime_ns keys the cache"""
+    if os.path.isdir(path):
+        return ET.parse(os.path.join(path, 'manifest.safe')).getroot()
+    # Only the central directory and this one small entry are read, not the
+    # multi-GB measurement TIFFs
+    with zipfile.ZipFile(path) as z:
+        name = next(n for n in z.namelist() if n.endswith('.SAFE/manifest.safe'))
+        return ET.fromstring(z.read(name))
+
+
+def peek_safe_metadata(path):
+    """Start time, relative orbit and pass direction of a Sentinel-1 SAFE
+
+    Returns None if the manifest is missing or unreadable.
+    """
+    try:
+        manifest = _read_safe_manifest(path, os.stat(path).st_mtime_ns)
+    except (OSError, StopIteration, ET.ParseError, zipfile.BadZipFile):
+        return None
+    meta = {}
+    for el in manifest.iter():
+        tag = el.tag.rsplit('}', 1)[-1]
+        if tag == 'startTime' and 'start' not in meta:
+            meta['start'] = el.text
+        elif tag == 'relativeOrbitNumber' and el.get('type') == 'start':
+            meta['relative_orbit'] = int(el.text)
+        elif tag == 'pass':
+            meta['pass'] = el.text
+    return meta
+
+
+def _zip_stamp(path):
+    st = os.stat(path)
+    return f"{st.st_size} {st.st_mtime_ns}"
+
+
+def zip_verified(path):
+    """True if path.crc records a pass for the zip as it is now"""
+    try:
+        with open(path + '.crc') as f:
+            return f.read().strip() == _zip_stamp(path)
+    except OSError:
+        return False
+
+
+def verify_zip(path):
+    """True if every member of the zip at path matches its stored CRC-32
+
+    A pass is remembered in path.crc against the file's size and mtime, so
+    an unchanged download is only checked once. Module-level so it can run
+    in a worker process.
+    """
+    if zip_verified(path):
+        return True
+    stamp = _zip_stamp(path)
+
+    try:
+        with zipfile.ZipFile(path) as z:
+            if z.testzip() is not None:
+                return False
+    except (zipfile.BadZipFile, zlib.error, OSError, EOFError):
+        return False  # Truncated downloads have no central directory
+
+    with open(path + '.crc', 'w') as f:
+        f.write(stamp)
+    return True
+
 
 class LandSubsidenceAnalyzer:
     def __init__(self, root):
@@ -97,6 +346,17 @@ class LandSubsidenceAnalyzer:
 
         # Data storage
         self.displacement_files = []  # List of (date_pair, filepath, data, transform)
+        self.file_stack = None  # (file, row, col) memmap behind 'data' when all shapes match
+        self._cache_root = None  # Parent of every load's cache dir, removed at exit
+        self._cache_dir = None  # Scratch directory backing the memory-mapped rasters
+        self._masked_buf = None  # Reused output of apply_coherence_mask()
+        self._map_file = None  # displacement_files entry shown on the map
+        self.map_im = None
+        self._map_view = None  # (region, vmin, vmax) currently drawn in map_im
+        self._map_overlays = []  # Point/region artists drawn over map_im
+        self._map_background = None  # Map without its animated artists, for blitting
+        self._refine_job = None
+        self._coherence_job = None
         self.current_data = None
         self.current_transform = None
         self.current_crs = None
@@ -108,14 +368,14 @@ class LandSubsidenceAnalyzer:
         self.analysis_regions = []  # List of (x1, y1, x2, y2, name)
 
         # Time series data
-        self.time_series_data = {}  # {point_name: [(date, displacement), ...]}
+        self.time_series_data = {}  # {point_name: {'dates': datetime64[D], 'disps': metres}}
 
         # Click mode
         self.click_mode = tk.StringVar(value="none")  # none, point, region
         self.region_start = None
 
         # Custom colormaps
-        self.displacement_cmap = self.create_displacement_colormap()
+        self.displacement_cmap = DISPLACEMENT_CMAP
 
         # ASF Download & ISCE2 Processing variables
         self.earthdata_user = tk.StringVar()
@@ -129,6 +389,7 @@ class LandSubsidenceAnalyzer:
         self.track_number = tk.StringVar()
         self.flight_direction = tk.StringVar(value="ASCENDING")
         self.conda_env = tk.StringVar(value="isce2")
+        self.parallel_downloads = tk.IntVar(value=PARALLEL_DOWNLOADS)
 
         # ASF search results and processing state
         self.asf_search_results = []
@@ -138,19 +399,28 @@ class LandSubsidenceAnalyzer:
         self.download_thread = None
         self.is_processing = False
         self.is_downloading = False
+        self._ui_updates = Queue()  # (kind, value) posted by worker threads
+        self._ui_poll_job = None
+        self._asf_session = None  # (credentials key, ASFSession) reused across downloads
+        self._signed_session = None  # Credential-free session for signed redirect URLs
+        self._cpu_pool = None  # Worker processes for CPU-bound checks, started on first use
 
         self.setup_styles()
         self.create_widgets()
         self.check_dependencies()
 
-    def create_displacement_colormap(self):
-        """Create custom colormap for displacement (blue=uplift, red=subsidence)"""
-        colors_list = [
-            '#0000ff', '#4444ff', '#8888ff', '#ccccff',
-            '#ffffff',
-            '#ffcccc', '#ff8888', '#ff4444', '#ff0000'
-        ]
-        return LinearSegmentedColormap.from_list('displacement', colors_list, N=256)
+    def colorize(self, data, vmin, vmax):
+        """Map data through the displacement LUT into an RGBA image"""
+        n = len(DISPLACEMENT_LUT) - 1
+        scale = np.float32(n / (vmax - vmin)) if vmax > vmin else np.float32(0)
+        idx = np.subtract(np.asarray(data), np.float32(vmin), dtype=np.float32)
+        idx *= scale
+        finite = np.isfinite(idx)
+        idx[~finite] = 0
+        np.clip(idx, 0, n - 1, out=idx)
+        codes = idx.astype(np.uint16)
+        codes[~finite] = n
+        return DISPLACEMENT_LUT[codes]
 
     def check_dependencies(self):
         """Check and report missing dependencies"""
@@ -438,6 +708,12 @@ class LandSubsidenceAnalyzer:
                 bg=self.colors['bg_light'], fg=self.colors['text'],
                 insertbackground=self.colors['text'], relief=tk.FLAT,
                 font=('Segoe UI', 8)).pack(side=tk.LEFT, padx=(5, 0), ipady=2)
+        tk.Spinbox(env_frame, from_=1, to=MAX_PARALLEL_DOWNLOADS, textvariable=self.parallel_downloads,
+                  width=3, bg=self.colors['bg_light'], fg=self.colors['text'],
+                  buttonbackground=self.colors['bg_light'], relief=tk.FLAT,
+                  font=('Segoe UI', 8)).pack(side=tk.RIGHT, ipady=2)
+        tk.Label(env_frame, text="Parallel:", bg=self.colors['bg_medium'],
+                fg=self.colors['text_secondary'], font=('Segoe UI', 8)).pack(side=tk.RIGHT, padx=(0, 5))
 
     def create_analysis_card(self, parent):
         body = self.create_card(parent, "ANALYSIS TOOLS")
@@ -465,7 +741,7 @@ class LandSubsidenceAnalyzer:
         coh_frame.pack(fill=tk.X, pady=(5, 0))
 
         tk.Scale(coh_frame, variable=self.coh_threshold, from_=0.0, to=1.0, resolution=0.05,
-                orient=tk.HORIZONTAL, bg=self.colors['bg_medium'], fg=self.colors['text'],
+                command=self.on_coherence_changed, orient=tk.HORIZONTAL, bg=self.colors['bg_medium'], fg=self.colors['text'],
                 highlightthickness=0, troughcolor=self.colors['bg_light']).pack(fill=tk.X)
 
         # Reference point
@@ -531,8 +807,6 @@ class LandSubsidenceAnalyzer:
 
     def create_map_tab(self, parent):
         """Create the displacement map visualization tab"""
-        plt.style.use('dark_background')
-
         self.map_fig = Figure(figsize=(10, 8), facecolor=self.colors['bg_dark'])
         self.map_ax = self.map_fig.add_subplot(111)
         self.map_ax.set_facecolor(self.colors['bg_medium'])
@@ -550,6 +824,7 @@ class LandSubsidenceAnalyzer:
 
         # Connect click event
         self.map_canvas.mpl_connect('button_press_event', self.on_map_click)
+        self.map_canvas.mpl_connect('draw_event', self.on_map_draw)
 
         toolbar_frame = tk.Frame(parent, bg=self.colors['bg_medium'])
         toolbar_frame.pack(fill=tk.X)
@@ -601,45 +876,138 @@ class LandSubsidenceAnalyzer:
             self.folder_path.set(folder)
             self.status_var.set(f"Selected: {os.path.basename(folder)}")
 
-    def read_geotiff(self, filepath):
-        """Read GeoTIFF and return data, transform, and CRS"""
+    def read_geotiff(self, filepath, out=None, target_shape=None):
+        """Read GeoTIFF and return data, transform, and CRS; data is decoded into out if given
+
+        With target_shape (rows, cols) a decimated copy is read instead, from the
+        file's internal overviews when it has them.
+        """
         if HAS_GDAL:
             ds = gdal.Open(filepath)
             if ds is None:
                 raise Exception(f"Could not open: {filepath}")
 
-            data = ds.ReadAsArray().astype(np.float64)
+            band = ds.GetRasterBand(1)
+            rows, cols = ds.RasterYSize, ds.RasterXSize
+            block_cols, block_rows = band.GetBlockSize()
+            if target_shape is not None:
+                data = band.ReadAsArray(buf_xsize=target_shape[1], buf_ysize=target_shape[0],
+                                        buf_type=gdal.GDT_Float32)
+            elif block_cols < cols:
+                data = np.empty((rows, cols), dtype=RASTER_DTYPE) if out is None else out
+                # Tiled: read one full row of tiles at a time
+                for y0 in range(0, rows, block_rows):
+                    n = min(block_rows, rows - y0)
+                    band.ReadAsArray(0, y0, cols, n, buf_obj=data[y0:y0 + n])
+            else:
+                data = np.empty((rows, cols), dtype=RASTER_DTYPE) if out is None else out
+                band.ReadAsArray(buf_obj=data)
             transform = ds.GetGeoTransform()
             crs = ds.GetProjection()
-            nodata = ds.GetRasterBand(1).GetNoDataValue()
+            nodata = band.GetNoDataValue()
+            band = None
             ds = None
 
-            if nodata is not None:
-                data = np.where(data == nodata, np.nan, data)
-
+            self.mask_nodata(data, nodata)
             return data, transform, crs
 
         elif HAS_RASTERIO:
-            with rasterio.open(filepath) as src:
-                data = src.read(1).astype(np.float64)
+            with rasterio.Env(GDAL_CACHEMAX=GDAL_CACHE_MB, GDAL_SWATH_SIZE=GDAL_SWATH_BYTES,
+                              GDAL_NUM_THREADS=GDAL_NUM_THREADS), \
+                    rasterio.open(filepath) as src:
+                rows, cols = src.shape
+                block_rows, block_cols = src.block_shapes[0]
+                if target_shape is not None:
+                    data = src.read(1, out_shape=target_shape, out_dtype=RASTER_DTYPE)
+                elif block_cols < cols:
+                    data = np.empty((rows, cols), dtype=RASTER_DTYPE) if out is None else out
+                    # Tiled: read one full row of tiles at a time
+                    for y0 in range(0, rows, block_rows):
+                        n = min(block_rows, rows - y0)
+                        src.read(1, out=data[y0:y0 + n], window=((y0, y0 + n), (0, cols)))
+                else:
+                    data = np.empty((rows, cols), dtype=RASTER_DTYPE) if out is None else out
+                    src.read(1, out=data)
                 transform = src.transform
                 crs = str(src.crs) if src.crs else None
                 nodata = src.nodata
 
-                if nodata is not None:
-                    data = np.where(data == nodata, np.nan, data)
+            self.mask_nodata(data, nodata)
+            return data, transform, crs
+        else:
+            raise Exception("No GeoTIFF reader available")
 
-                return data, transform, crs
+    @staticmethod
+    def mask_nodata(data, nodata):
+        """Set NoData pixels of a float array to NaN in place"""
+        if nodata is None or np.isnan(nodata):
+            return
+        mask = data == data.dtype.type(nodata)
+        # putmask avoids building an index array; skip it for rasters with no gaps
+        if mask.any():
+            np.putmask(data, mask, np.nan)
+
+    def reset_raster_cache(self):
+        """Replace the memmap scratch directory, discarding a previous load"""
+        # Drop every reference to the old memmaps (previews live in the file
+        # dicts) first; Windows won't delete a file that is still mapped
+        self.displacement_files = []
+        self.file_stack = None
+        self.current_data = None
+        self._map_file = None
+        if self._cache_root is None:
+            self._cache_root = tempfile.mkdtemp(prefix='lsa_cache_')
+            atexit.register(shutil.rmtree, self._cache_root, True)
+        if self._cache_dir is not None:
+            shutil.rmtree(self._cache_dir, ignore_errors=True)
+        self._cache_dir = tempfile.mkdtemp(prefix='load_', dir=self._cache_root)
+
+    def cache_raster(self, shape, name):
+        """New RASTER_DTYPE memmap in the cache directory, so unused dates can page out"""
+        path = os.path.join(self._cache_dir, f"{name}.npy")
+        return np.lib.format.open_memmap(path, mode='w+', dtype=RASTER_DTYPE, shape=shape)
+
+    def raster_header(self, filepath):
+        """(rows, cols), transform and CRS of a GeoTIFF, without decoding pixels"""
+        if HAS_GDAL:
+            ds = gdal.Open(filepath)
+            if ds is None:
+                raise Exception(f"Could not open: {filepath}")
+            return (ds.RasterYSize, ds.RasterXSize), ds.GetGeoTransform(), ds.GetProjection()
+        elif HAS_RASTERIO:
+            with rasterio.open(filepath) as src:
+                return src.shape, src.transform, str(src.crs) if src.crs else None
         else:
             raise Exception("No GeoTIFF reader available")
 
+    def ensure_decoded(self, files):
+        """Decode any of files not read yet into their memmaps, in parallel"""
+        pending = [info for info in files if not info['decoded']]
+        if not pending:
+            return
+        status = self.status_var.get()
+        self.status_var.set(f"Reading {len(pending)} displacement file(s)...")
+        self.root.update_idletasks()
+        with ThreadPoolExecutor(max_workers=min(READ_WORKERS, len(pending))) as pool:
+            futures = [pool.submit(self.read_geotiff, info['path'], info['data'])
+                       for info in pending]
+        for info, future in zip(pending, futures):
+            try:
+                future.result()
+            except Exception as e:
+                # Leave no stale zeros behind: an unreadable date shows as no data
+                print(f"Error loading {info['path']}: {e}")
+                info['data'].fill(np.nan)
+            info['decoded'] = True
+        self.status_var.set(status)
+
     def parse_date_from_filename(self, filename):
         """Extract date pair from ASF InSAR filename"""
-        # Pattern: S1AA_20150817T223551_20150829T223551_...
-        match = re.search(r'(\d{8})T\d{6}_(\d{8})T\d{6}', filename)
+        match = DATE_PAIR_PATTERN.search(filename)
         if match:
-            date1 = datetime.strptime(match.group(1), '%Y%m%d')
-            date2 = datetime.strptime(match.group(2), '%Y%m%d')
+            d1, d2 = match.groups()
+            date1 = datetime(int(d1[:4]), int(d1[4:6]), int(d1[6:]))
+            date2 = datetime(int(d2[:4]), int(d2[4:6]), int(d2[6:]))
             return date1, date2
         return None, None
 
@@ -652,58 +1020,68 @@ class LandSubsidenceAnalyzer:
 
         try:
             self.status_var.set("Scanning for displacement files...")
-            self.displacement_files = []
+            self.reset_raster_cache()
             self.file_listbox.delete(0, tk.END)
 
-            # Search for displacement files (los_disp, vert_disp)
-            patterns = ['*los_disp*.tif', '*vert_disp*.tif', '*displacement*.tif', '*disp*.tif']
-            tif_files = []
-
-            for pattern in patterns:
-                tif_files.extend(glob.glob(os.path.join(folder, '**', pattern), recursive=True))
-
-            # Remove duplicates
-            tif_files = list(set(tif_files))
+            # One walk finds displacement (los_disp, vert_disp), coherence and DEM files
+            tif_files, coh_files, dem_files = self.scan_products(folder)
 
             if not tif_files:
                 messagebox.showwarning("Warning", "No displacement files found!")
                 return
 
-            # Load each file
-            for filepath in sorted(tif_files):
+            # Only headers are read here; each raster is decoded into its memmap
+            # the first time it is shown or analyzed (see ensure_decoded). The
+            # memmaps are one (file, row, col) stack when all shapes agree
+            tif_files = sorted(tif_files)
+            with ThreadPoolExecutor(max_workers=READ_WORKERS) as pool:
+                header_futures = [pool.submit(self.raster_header, path) for path in tif_files]
+            headers = {}
+            for filepath, future in zip(tif_files, header_futures):
                 try:
-                    data, transform, crs = self.read_geotiff(filepath)
-                    date1, date2 = self.parse_date_from_filename(filepath)
-
-                    fname = os.path.basename(filepath)
-                    if date1 and date2:
-                        display_name = f"{date1.strftime('%Y-%m-%d')} to {date2.strftime('%Y-%m-%d')}"
-                    else:
-                        display_name = fname[:50]
-
-                    self.displacement_files.append({
-                        'path': filepath,
-                        'name': fname,
-                        'display_name': display_name,
-                        'data': data,
-                        'transform': transform,
-                        'crs': crs,
-                        'date1': date1,
-                        'date2': date2
-                    })
-
-                    self.file_listbox.insert(tk.END, display_name)
-
+                    headers[filepath] = future.result()
                 except Exception as e:
                     print(f"Error loading {filepath}: {e}")
+            tif_files = [path for path in tif_files if path in headers]
+
+            shapes = {headers[path][0] for path in tif_files}
+            if len(shapes) == 1:
+                self.file_stack = self.cache_raster((len(tif_files),) + shapes.pop(), "stack")
+                buffers = list(self.file_stack)
+            else:
+                buffers = [self.cache_raster(headers[path][0], f"disp_{i:04d}")
+                           for i, path in enumerate(tif_files)]
+
+            for slot, (filepath, data) in enumerate(zip(tif_files, buffers)):
+                _, transform, crs = headers[filepath]
+                date1, date2 = self.parse_date_from_filename(filepath)
+
+                fname = os.path.basename(filepath)
+                if date1 and date2:
+                    display_name = f"{date1.strftime('%Y-%m-%d')} to {date2.strftime('%Y-%m-%d')}"
+                else:
+                    display_name = fname[:50]
+
+                self.displacement_files.append({
+                    'path': filepath,
+                    'name': fname,
+                    'display_name': display_name,
+                    'data': data,
+                    'decoded': False,  # data is filled by ensure_decoded
+                    'transform': transform,
+                    'crs': crs,
+                    'date1': date1,
+                    'date2': date2,
+                    'slot': slot  # Index into file_stack
+                })
+
+                self.file_listbox.insert(tk.END, display_name)
 
             # Also load coherence if available
-            coh_files = glob.glob(os.path.join(folder, '**', '*corr*.tif'), recursive=True)
             if coh_files:
                 self.coherence_data, _, _ = self.read_geotiff(coh_files[0])
 
             # Load DEM if available
-            dem_files = glob.glob(os.path.join(folder, '**', '*dem*.tif'), recursive=True)
             if dem_files:
                 self.dem_data, _, _ = self.read_geotiff(dem_files[0])
 
@@ -716,6 +1094,27 @@ class LandSubsidenceAnalyzer:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load data: {str(e)}")
 
+    def scan_products(self, folder):
+        """Walk folder once, returning displacement, coherence and DEM GeoTIFF paths"""
+        disp_files, coh_files, dem_files = [], [], []
+        for dirpath, dirnames, filenames in os.walk(folder):
+            # Skip hidden entries, as glob does
+            dirnames[:] = [d for d in dirnames if not d.startswith('.')]
+            for name in filenames:
+                # normcase makes the checks case-insensitive on Windows only, like glob
+                stem = os.path.normcase(name)
+                if name.startswith('.') or not stem.endswith('.tif'):
+                    continue
+                stem = stem[:-4]
+                path = os.path.join(dirpath, name)
+                if 'disp' in stem:  # also covers *displacement*
+                    disp_files.append(path)
+                if 'corr' in stem:
+                    coh_files.append(path)
+                if 'dem' in stem:
+                    dem_files.append(path)
+        return disp_files, coh_files, dem_files
+
     def load_hdf5_timeseries(self):
         """Load HDF5 time series file"""
         if not HAS_H5PY:
@@ -735,23 +1134,21 @@ class LandSubsidenceAnalyzer:
             self.status_var.set("Loading HDF5 time series...")
 
             with h5py.File(filepath, 'r') as f:
-                # Print structure for debugging
-                def print_structure(name, obj):
-                    print(name)
-                f.visititems(print_structure)
-
                 # Try common dataset names
                 possible_names = ['timeseries', 'displacement', 'velocity', 'data']
                 data = None
 
+                # Only the dataset header is needed here; reading the cube
+                # would decompress every epoch just to report its shape
                 for name in possible_names:
                     if name in f:
-                        data = f[name][:]
+                        data = f[name]
                         break
 
                 if data is not None:
                     messagebox.showinfo("Success",
                         f"Loaded HDF5 data with shape: {data.shape}\n"
+                        f"Chunks: {data.chunks or 'contiguous'}, compression: {data.compression}\n"
                         f"Keys found: {list(f.keys())}")
                 else:
                     messagebox.showinfo("HDF5 Structure",
@@ -766,7 +1163,9 @@ class LandSubsidenceAnalyzer:
     def on_file_select(self, event):
         """Handle file selection from listbox"""
         selection = self.file_listbox.curselection()
-        if selection:
+        # Re-selecting the file already on the map keeps it (and its zoom) as is
+        if selection and selection[0] < len(self.displacement_files) \
+                and self.displacement_files[selection[0]] is not self._map_file:
             self.display_displacement(selection[0])
 
     def display_displacement(self, index):
@@ -775,37 +1174,34 @@ class LandSubsidenceAnalyzer:
             return
 
         file_info = self.displacement_files[index]
+        self._map_file = file_info
         data = file_info['data']
         self.current_data = data
         self.current_transform = file_info['transform']
         self.current_crs = file_info['crs']
 
-        # Apply coherence mask if available
-        if self.coherence_data is not None and self.coherence_data.shape == data.shape:
-            threshold = self.coh_threshold.get()
-            masked_data = np.where(self.coherence_data >= threshold, data, np.nan)
-        else:
-            masked_data = data
-
-        # Calculate display range
-        valid_data = masked_data[np.isfinite(masked_data)]
-        if len(valid_data) > 0:
-            vmin, vmax = np.percentile(valid_data, [2, 98])
-            # Make symmetric around zero for displacement
-            max_abs = max(abs(vmin), abs(vmax))
-            vmin, vmax = -max_abs, max_abs
-        else:
-            vmin, vmax = -0.1, 0.1
-
-        # Clear and plot
+        # The map is drawn from an overview at about screen resolution, read
+        # decimated from the file until it is decoded; zooming in redraws the
+        # visible part from the full raster
         self.map_fig.clear()
+        self._map_background = None
         self.map_ax = self.map_fig.add_subplot(111)
         self.map_ax.set_facecolor(self.colors['bg_medium'])
 
-        im = self.map_ax.imshow(masked_data, cmap=self.displacement_cmap, vmin=vmin, vmax=vmax)
+        region = (0, data.shape[0], 0, data.shape[1])
+        view, step = self.sample_view(region)
+
+        # Calculate display range
+        vmin, vmax = self.display_range(view)
+
+        # Colors are looked up once here so matplotlib only resamples RGBA
+        self.map_im = self.map_ax.imshow(self.colorize(view, vmin, vmax),
+                                         extent=self.view_extent(region, step, view.shape))
+        self._map_view = (region, vmin, vmax)
 
         # Add colorbar
-        cbar = self.map_fig.colorbar(im, ax=self.map_ax, shrink=0.8)
+        mappable = ScalarMappable(norm=Normalize(vmin, vmax), cmap=self.displacement_cmap)
+        cbar = self.map_fig.colorbar(mappable, ax=self.map_ax, shrink=0.8)
         cbar.set_label('Displacement (m)', color=self.colors['text_secondary'])
         cbar.ax.yaxis.set_tick_params(color=self.colors['text_secondary'])
         plt.setp(plt.getp(cbar.ax.axes, 'yticklabels'), color=self.colors['text_secondary'])
@@ -820,25 +1216,200 @@ class LandSubsidenceAnalyzer:
         # Plot existing analysis points
         self.plot_analysis_points()
 
+        # Full draws skip animated artists, so on_map_draw can snapshot the background
+        self.set_map_animated(True)
         self.map_fig.tight_layout()
-        self.map_canvas.draw()
+        self.map_ax.callbacks.connect('xlim_changed', self.on_map_view_changed)
+        self.map_ax.callbacks.connect('ylim_changed', self.on_map_view_changed)
+        self.map_canvas.draw_idle()
 
         self.status_var.set(f"Displaying: {file_info['name']}")
 
+    def on_map_draw(self, event):
+        """After a full draw: keep the background for blitting, then add the animated artists"""
+        if self.map_im is None or self.map_canvas.is_saving():
+            return
+        self._map_background = self.map_canvas.copy_from_bbox(self.map_fig.bbox)
+        self.draw_map_animated()
+
+    def map_animated_artists(self):
+        """The image plus everything drawn above it, in draw order"""
+        artists = [self.map_im] + self._map_overlays + list(self.map_ax.spines.values())
+        return sorted(artists, key=lambda artist: artist.get_zorder())
+
+    def set_map_animated(self, animated):
+        for artist in self.map_animated_artists():
+            artist.set_animated(animated)
+
+    def draw_map_animated(self):
+        for artist in self.map_animated_artists():
+            self.map_ax.draw_artist(artist)
+
+    def on_coherence_changed(self, value):
+        if self._coherence_job is not None:
+            self.root.after_cancel(self._coherence_job)
+        self._coherence_job = self.root.after(COHERENCE_DEBOUNCE_MS, self._apply_coherence)
+
+    def _apply_coherence(self):
+        self._coherence_job = None
+        self.update_map_image()
+
+    def update_map_image(self):
+        """Re-mask the drawn region and blit only the image and its overlays"""
+        if self.map_im is None or self.current_data is None:
+            return
+        region, vmin, vmax = self._map_view
+        view, _ = self.sample_view(region)
+        self.map_im.set_data(self.colorize(view, vmin, vmax))
+        self.blit_map()
+
+    def refresh_map_overlays(self):
+        """Replot points and regions over the current map without rebuilding it"""
+        if self.map_im is None:
+            return
+        for artist in self._map_overlays:
+            artist.remove()
+        self.plot_analysis_points()
+        self.set_map_animated(True)
+        self.blit_map()
+
+    def blit_map(self):
+        """Redraw the animated map artists over the saved background"""
+        if self._map_background is None:
+            self.map_canvas.draw_idle()
+            return
+        self.map_canvas.restore_region(self._map_background)
+        self.draw_map_animated()
+        self.map_canvas.blit(self.map_fig.bbox)
+
+    def sample_view(self, region):
+        """Coherence-masked samples of region, strided down to the map's pixel size"""
+        row0, row1, col0, col1 = region
+        rows, cols = self.current_data.shape
+        box = self.map_ax.get_position(original=True).transformed(self.map_fig.transFigure)
+        step = max(1, min((row1 - row0) // max(1, int(box.height)),
+                          (col1 - col0) // max(1, int(box.width))))
+        file_info = self._map_file
+
+        view = None
+        if region == (0, rows, 0, cols) and not file_info['decoded']:
+            # Same shape as the strided view, but only ~screen-sized pixels are decoded
+            shape = (-(-rows // step), -(-cols // step))
+            view = file_info.get('preview')
+            if view is None or view.shape != shape:
+                try:
+                    view, _, _ = self.read_geotiff(file_info['path'], target_shape=shape)
+                    file_info['preview'] = view
+                except Exception as e:
+                    print(f"Error reading overview of {file_info['path']}: {e}")
+                    view = None
+        if view is None:
+            self.ensure_decoded([file_info])
+            view = self.current_data[row0:row1:step, col0:col1:step]
+
+        coh = self.coherence_data
+        if coh is not None and coh.shape == self.current_data.shape:
+            view = self.apply_coherence_mask(view, coh[row0:row1:step, col0:col1:step],
+                                             self.coh_threshold.get())
+        return view, step
+
+    def display_range(self, view):
+        """Display range from the 2-98 % percentiles of view, symmetric around zero"""
+        if HAS_NUMBA:
+            # Two passes over view: min/max, then a histogram to read percentiles from
+            lo, hi, count = _finite_range(view)
+            if count == 0:
+                return -0.1, 0.1
+            if lo == hi:
+                vmin, vmax = lo, hi
+            else:
+                counts = _finite_hist(view, lo, hi, PERCENTILE_BINS)
+                edges = np.linspace(lo, hi, PERCENTILE_BINS + 1)
+                cdf = np.concatenate(([0], np.cumsum(counts)))
+                vmin, vmax = np.interp(np.array([0.02, 0.98]) * cdf[-1], cdf, edges)
+        else:
+            valid_data = view[np.isfinite(view)]
+            if len(valid_data) == 0:
+                return -0.1, 0.1
+            # valid_data is already a copy, so partition it in place
+            vmin, vmax = np.percentile(valid_data, [2, 98], overwrite_input=True)
+
+        # Make symmetric around zero for displacement
+        max_abs = max(abs(float(vmin)), abs(float(vmax)))
+        return -max_abs, max_abs
+
+    @staticmethod
+    def view_extent(region, step, shape):
+        """imshow extent placing a strided view back in full-raster pixel coordinates"""
+        row0, col0 = region[0], region[2]
+        rows, cols = shape
+        return (col0 - 0.5, col0 + cols * step - 0.5, row0 + rows * step - 0.5, row0 - 0.5)
+
+    def on_map_view_changed(self, ax):
+        # Debounce: only the view the toolbar settles on gets re-read
+        if self._refine_job is not None:
+            self.root.after_cancel(self._refine_job)
+        self._refine_job = self.root.after(REFINE_DELAY_MS, self.refine_map_view)
+
+    def refine_map_view(self):
+        """Redraw the visible part of the map from the full-resolution raster"""
+        self._refine_job = None
+        if self.map_im is None or self.current_data is None:
+            return
+
+        rows, cols = self.current_data.shape
+        xlim, ylim = self.map_ax.get_xlim(), self.map_ax.get_ylim()
+        (x0, x1), (y0, y1) = sorted(xlim), sorted(ylim)
+        col0, col1 = max(0, int(np.floor(x0 + 0.5))), min(cols, int(np.ceil(x1 + 0.5)))
+        row0, row1 = max(0, int(np.floor(y0 + 0.5))), min(rows, int(np.ceil(y1 + 0.5)))
+        region = (row0, row1, col0, col1)
+        if row1 <= row0 or col1 <= col0 or region == self._map_view[0]:
+            return
+
+        _, vmin, vmax = self._map_view
+        view, step = self.sample_view(region)
+        self._map_view = (region, vmin, vmax)
+        self.map_im.set_data(self.colorize(view, vmin, vmax))
+        self.map_im.set_extent(self.view_extent(region, step, view.shape))
+        # set_extent may autoscale; keep the user's view
+        self.map_ax.set_xlim(xlim, emit=False)
+        self.map_ax.set_ylim(ylim, emit=False)
+        self.map_canvas.draw_idle()
+
+    def apply_coherence_mask(self, data, coh, threshold):
+        """Masked copy of data in a buffer reused between redraws"""
+        if self._masked_buf is None or self._masked_buf.shape != data.shape:
+            self._masked_buf = np.empty(data.shape, dtype=RASTER_DTYPE)
+        out = self._masked_buf
+
+        if HAS_NUMBA:
+            _coherence_mask(np.asarray(data), np.asarray(coh), RASTER_DTYPE(threshold), out)
+        else:
+            out.fill(np.nan)
+            np.copyto(out, data, where=coh >= threshold)
+        return out
+
     def plot_analysis_points(self):
         """Plot analysis points on map"""
-        for i, (x, y, name) in enumerate(self.analysis_points):
-            self.map_ax.plot(x, y, 'o', markersize=10, markerfacecolor='yellow',
-                            markeredgecolor='black', markeredgewidth=2)
-            self.map_ax.annotate(name, (x, y), xytext=(5, 5), textcoords='offset points',
-                                fontsize=9, color='yellow', fontweight='bold')
-
+        overlays = self._map_overlays = []
+        # All markers share one Line2D and all rectangles one collection,
+        # so each is a single artist to draw however many there are
+        if self.analysis_points:
+            xs, ys, _ = zip(*self.analysis_points)
+            overlays += self.map_ax.plot(xs, ys, 'o', markersize=10, markerfacecolor='yellow',
+                                         markeredgecolor='black', markeredgewidth=2)
+        for x, y, name in self.analysis_points:
+            overlays.append(self.map_ax.annotate(name, (x, y), xytext=(5, 5), textcoords='offset points',
+                                                 fontsize=9, color='yellow', fontweight='bold'))
+
+        if self.analysis_regions:
+            rects = [Rectangle((x1, y1), x2-x1, y2-y1) for x1, y1, x2, y2, _ in self.analysis_regions]
+            overlays.append(self.map_ax.add_collection(
+                PatchCollection(rects, facecolor='none', edgecolor='yellow', linewidth=2,
+                                joinstyle='miter')))
         for x1, y1, x2, y2, name in self.analysis_regions:
-            rect = Rectangle((x1, y1), x2-x1, y2-y1, fill=False,
-                             edgecolor='yellow', linewidth=2)
-            self.map_ax.add_patch(rect)
-            self.map_ax.annotate(name, (x1, y1), xytext=(5, -15), textcoords='offset points',
-                                fontsize=9, color='yellow', fontweight='bold')
+            overlays.append(self.map_ax.annotate(name, (x1, y1), xytext=(5, -15), textcoords='offset points',
+                                                 fontsize=9, color='yellow', fontweight='bold'))
 
     def on_map_click(self, event):
         """Handle click on map"""
@@ -857,7 +1428,7 @@ class LandSubsidenceAnalyzer:
             self.update_ref_combo()
 
             # Redraw
-            self.display_displacement(self.file_listbox.curselection()[0] if self.file_listbox.curselection() else 0)
+            self.refresh_map_overlays()
 
             self.status_var.set(f"Added point {name} at ({x}, {y})")
 
@@ -873,7 +1444,7 @@ class LandSubsidenceAnalyzer:
                 self.region_start = None
 
                 # Redraw
-                self.display_displacement(self.file_listbox.curselection()[0] if self.file_listbox.curselection() else 0)
+                self.refresh_map_overlays()
 
                 self.status_var.set(f"Added region {name}")
 
@@ -909,8 +1480,7 @@ class LandSubsidenceAnalyzer:
         self.update_ref_combo()
 
         # Redraw
-        if self.displacement_files:
-            self.display_displacement(self.file_listbox.curselection()[0] if self.file_listbox.curselection() else 0)
+        self.refresh_map_overlays()
 
     def clear_all_points(self):
         """Clear all analysis points and regions"""
@@ -918,9 +1488,7 @@ class LandSubsidenceAnalyzer:
         self.analysis_regions = []
         self.points_listbox.delete(0, tk.END)
         self.update_ref_combo()
-
-        if self.displacement_files:
-            self.display_displacement(self.file_listbox.curselection()[0] if self.file_listbox.curselection() else 0)
+        self.refresh_map_overlays()
 
     def analyze_points(self):
         """Analyze displacement at selected points"""
@@ -932,31 +1500,43 @@ class LandSubsidenceAnalyzer:
             messagebox.showwarning("Warning", "Load displacement data first!")
             return
 
+        self.ensure_decoded(self.displacement_files)
         self.status_var.set("Analyzing points...")
 
-        # Get reference point displacement if set
-        ref_disp = 0
+        # Column of the reference point, if set
         ref_name = self.ref_point_var.get()
-        if ref_name != "None":
-            for x, y, name in self.analysis_points:
-                if name == ref_name:
-                    ref_disp = self.current_data[y, x] if np.isfinite(self.current_data[y, x]) else 0
-                    break
+        ref_k = next((k for k, p in enumerate(self.analysis_points) if p[2] == ref_name), None)
 
         # Collect time series data
         self.time_series_data = {}
 
-        for x, y, name in self.analysis_points:
-            self.time_series_data[name] = []
-
-            for file_info in self.displacement_files:
+        # Gather every point from every file with fancy indexing
+        xs = np.array([p[0] for p in self.analysis_points], dtype=np.intp)
+        ys = np.array([p[1] for p in self.analysis_points], dtype=np.intp)
+        values = np.full((len(self.displacement_files), len(xs)), np.nan, dtype=RASTER_DTYPE)
+        dates = np.array([file_info['date2'] or datetime.now() for file_info in self.displacement_files],
+                         dtype='datetime64[D]')
+
+        if self.file_stack is not None:
+            _, rows, cols = self.file_stack.shape
+            inside = (ys >= 0) & (ys < rows) & (xs >= 0) & (xs < cols)
+            slots = [file_info['slot'] for file_info in self.displacement_files]
+            values[:, inside] = self.file_stack[:, ys[inside], xs[inside]][slots]
+        else:
+            for t, file_info in enumerate(self.displacement_files):
                 data = file_info['data']
-                if 0 <= y < data.shape[0] and 0 <= x < data.shape[1]:
-                    disp = data[y, x]
-                    if np.isfinite(disp):
-                        disp -= ref_disp  # Apply reference correction
-                        date = file_info['date2'] or datetime.now()
-                        self.time_series_data[name].append((date, disp))
+                inside = (ys >= 0) & (ys < data.shape[0]) & (xs >= 0) & (xs < data.shape[1])
+                values[t, inside] = data[ys[inside], xs[inside]]
+
+        # Apply reference correction: each date relative to the reference
+        # point in that same file (no correction where it has no data)
+        if ref_k is not None:
+            ref_disp = np.nan_to_num(values[:, ref_k], nan=0.0)
+            values -= ref_disp[:, None]
+
+        for k, (x, y, name) in enumerate(self.analysis_points):
+            valid = np.isfinite(values[:, k])
+            self.time_series_data[name] = {'dates': dates[valid], 'disps': values[valid, k]}
 
         # Plot time series
         self.plot_time_series()
@@ -974,14 +1554,11 @@ class LandSubsidenceAnalyzer:
 
         colors_list = plt.cm.tab10.colors
 
-        for i, (name, data) in enumerate(self.time_series_data.items()):
-            if data:
-                dates = [d[0] for d in data]
-                disps = [d[1] * 1000 for d in data]  # Convert to mm
-
+        for i, (name, series) in enumerate(self.time_series_data.items()):
+            if len(series['disps']):
                 color = colors_list[i % len(colors_list)]
-                self.ts_ax.plot(dates, disps, 'o-', label=name, color=color,
-                               markersize=8, linewidth=2)
+                self.ts_ax.plot(series['dates'], series['disps'] * 1000, 'o-', label=name,  # mm
+                               color=color, markersize=8, linewidth=2)
 
         self.ts_ax.axhline(y=0, color='white', linestyle='--', alpha=0.5)
 
@@ -1007,57 +1584,58 @@ class LandSubsidenceAnalyzer:
 
     def update_statistics(self):
         """Update statistics display"""
-        self.stats_text.config(state=tk.NORMAL)
-        self.stats_text.delete(1.0, tk.END)
-
-        self.stats_text.insert(tk.END, "=" * 60 + "\n")
-        self.stats_text.insert(tk.END, "     LAND SUBSIDENCE ANALYSIS REPORT\n")
-        self.stats_text.insert(tk.END, "=" * 60 + "\n\n")
+        # Collected here and inserted into the widget in one call
+        report = []
+        report.append("=" * 60 + "\n")
+        report.append("     LAND SUBSIDENCE ANALYSIS REPORT\n")
+        report.append("=" * 60 + "\n\n")
 
-        self.stats_text.insert(tk.END, f"Analysis Date: {datetime.now().strftime('%Y-%m-%d %H:%M')}\n")
-        self.stats_text.insert(tk.END, f"Number of Files: {len(self.displacement_files)}\n")
-        self.stats_text.insert(tk.END, f"Analysis Points: {len(self.analysis_points)}\n")
-        self.stats_text.insert(tk.END, f"Analysis Regions: {len(self.analysis_regions)}\n\n")
+        report.append(f"Analysis Date: {datetime.now().strftime('%Y-%m-%d %H:%M')}\n")
+        report.append(f"Number of Files: {len(self.displacement_files)}\n")
+        report.append(f"Analysis Points: {len(self.analysis_points)}\n")
+        report.append(f"Analysis Regions: {len(self.analysis_regions)}\n\n")
 
         # Overall statistics
         if self.current_data is not None:
             valid = self.current_data[np.isfinite(self.current_data)]
             if len(valid) > 0:
-                self.stats_text.insert(tk.END, "-" * 40 + "\n")
-                self.stats_text.insert(tk.END, "OVERALL DISPLACEMENT STATISTICS\n")
-                self.stats_text.insert(tk.END, "-" * 40 + "\n")
-                self.stats_text.insert(tk.END, f"  Mean:    {np.mean(valid)*1000:>10.2f} mm\n")
-                self.stats_text.insert(tk.END, f"  Median:  {np.median(valid)*1000:>10.2f} mm\n")
-                self.stats_text.insert(tk.END, f"  Std Dev: {np.std(valid)*1000:>10.2f} mm\n")
-                self.stats_text.insert(tk.END, f"  Min:     {np.min(valid)*1000:>10.2f} mm\n")
-                self.stats_text.insert(tk.END, f"  Max:     {np.max(valid)*1000:>10.2f} mm\n\n")
+                report.append("-" * 40 + "\n")
+                report.append("OVERALL DISPLACEMENT STATISTICS\n")
+                report.append("-" * 40 + "\n")
+                report.append(f"  Mean:    {np.mean(valid)*1000:>10.2f} mm\n")
+                report.append(f"  Median:  {np.median(valid)*1000:>10.2f} mm\n")
+                report.append(f"  Std Dev: {np.std(valid)*1000:>10.2f} mm\n")
+                report.append(f"  Min:     {np.min(valid)*1000:>10.2f} mm\n")
+                report.append(f"  Max:     {np.max(valid)*1000:>10.2f} mm\n\n")
 
                 # Subsidence area
                 subsidence_pixels = np.sum(valid < -0.01)  # > 10mm subsidence
                 total_pixels = len(valid)
-                self.stats_text.insert(tk.END, f"  Pixels with >10mm subsidence: {subsidence_pixels} ({100*subsidence_pixels/total_pixels:.1f}%)\n\n")
+                report.append(f"  Pixels with >10mm subsidence: {subsidence_pixels} ({100*subsidence_pixels/total_pixels:.1f}%)\n\n")
 
         # Point statistics
-        self.stats_text.insert(tk.END, "-" * 40 + "\n")
-        self.stats_text.insert(tk.END, "POINT-BY-POINT ANALYSIS\n")
-        self.stats_text.insert(tk.END, "-" * 40 + "\n\n")
-
-        for name, data in self.time_series_data.items():
-            if data:
-                disps = [d[1] * 1000 for d in data]
-                self.stats_text.insert(tk.END, f"  {name}:\n")
-                self.stats_text.insert(tk.END, f"    Displacement: {disps[-1]:.2f} mm\n")
-
-                if len(data) >= 2:
-                    # Calculate rate
-                    dates = [d[0] for d in data]
-                    days = (dates[-1] - dates[0]).days
-                    if days > 0:
-                        rate = (disps[-1] - disps[0]) / (days / 365.25)
-                        self.stats_text.insert(tk.END, f"    Rate: {rate:.2f} mm/year\n")
-
-                self.stats_text.insert(tk.END, "\n")
+        report.append("-" * 40 + "\n")
+        report.append("POINT-BY-POINT ANALYSIS\n")
+        report.append("-" * 40 + "\n\n")
+
+        for name, series in self.time_series_data.items():
+            if len(series['disps']):
+                disps = series['disps'] * 1000
+                report.append(f"  {name}:\n")
+                report.append(f"    Displacement: {disps[-1]:.2f} mm\n")
+
+                if len(disps) >= 2:
+                    # Rate from a least-squares line through every date
+                    years = (series['dates'] - series['dates'].min()).astype(np.float64) / 365.25
+                    if years.max() > 0:
+                        rate = np.polyfit(years, disps, 1)[0]
+                        report.append(f"    Rate: {rate:.2f} mm/year\n")
+
+                report.append("\n")
 
+        self.stats_text.config(state=tk.NORMAL)
+        self.stats_text.delete(1.0, tk.END)
+        self.stats_text.insert(tk.END, "".join(report))
         self.stats_text.config(state=tk.DISABLED)
 
     def export_geotiff(self):
@@ -1077,17 +1655,23 @@ class LandSubsidenceAnalyzer:
 
         try:
             if HAS_GDAL:
+                self.ensure_decoded([self._map_file])
                 driver = gdal.GetDriverByName('GTiff')
                 rows, cols = self.current_data.shape
-                ds = driver.Create(save_path, cols, rows, 1, gdal.GDT_Float32)
+                ds = driver.Create(save_path, cols, rows, 1, gdal.GDT_Float32, options=GEOTIFF_OPTIONS)
 
                 if self.current_transform:
                     ds.SetGeoTransform(self.current_transform)
                 if self.current_crs:
                     ds.SetProjection(self.current_crs)
 
-                ds.GetRasterBand(1).WriteArray(self.current_data)
-                ds.GetRasterBand(1).SetNoDataValue(np.nan)
+                band = ds.GetRasterBand(1)
+                band.SetNoDataValue(np.nan)
+                # One row of tiles at a time, straight from the memmap
+                for row0 in range(0, rows, GEOTIFF_BLOCK):
+                    band.WriteArray(self.current_data[row0:row0 + GEOTIFF_BLOCK], 0, row0)
+                band.FlushCache()
+                band = None
                 ds = None
 
                 messagebox.showinfo("Success", f"GeoTIFF saved to:\n{save_path}")
@@ -1113,25 +1697,30 @@ class LandSubsidenceAnalyzer:
             return
 
         try:
-            with open(save_path, 'w') as f:
-                f.write("Point,X,Y,Date,Displacement_m,Displacement_mm\n")
-
-                for name, data in self.time_series_data.items():
-                    # Find coordinates
-                    x, y = 0, 0
-                    for px, py, pname in self.analysis_points:
-                        if pname == name:
-                            x, y = px, py
-                            break
-
-                    for date, disp in data:
-                        f.write(f"{name},{x},{y},{date.strftime('%Y-%m-%d')},{disp:.6f},{disp*1000:.3f}\n")
+            coords = {name: (x, y) for x, y, name in self.analysis_points}
+            with open(save_path, 'w', newline='') as f:
+                writer = csv.writer(f, lineterminator='\n')
+                writer.writerow(['Point', 'X', 'Y', 'Date', 'Displacement_m', 'Displacement_mm'])
+                for name, series in self.time_series_data.items():
+                    x, y = coords.get(name, (0, 0))
+                    days = np.datetime_as_string(series['dates'], unit='D')
+                    writer.writerows((name, x, y, day, f"{disp:.6f}", f"{disp*1000:.3f}")
+                                     for day, disp in zip(days, series['disps']))
 
             messagebox.showinfo("Success", f"CSV saved to:\n{save_path}")
 
         except Exception as e:
             messagebox.showerror("Error", f"Export failed: {str(e)}")
 
+    def pixel_to_geo(self, xs, ys):
+        """Georeferenced coordinates of pixel columns/rows through the current transform"""
+        t = self.current_transform
+        if hasattr(t, 'to_gdal'):
+            t = t.to_gdal()  # rasterio Affine -> GDAL geotransform order
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        return t[0] + xs * t[1] + ys * t[2], t[3] + xs * t[4] + ys * t[5]
+
     def export_shapefile(self):
         """Export points to shapefile"""
         if not HAS_GDAL:
@@ -1170,31 +1759,36 @@ class LandSubsidenceAnalyzer:
             layer.CreateField(ogr.FieldDefn('X_pixel', ogr.OFTInteger))
             layer.CreateField(ogr.FieldDefn('Y_pixel', ogr.OFTInteger))
 
-            for x, y, name in self.analysis_points:
+            # Convert pixel to geo coordinates if transform available
+            xs = [p[0] for p in self.analysis_points]
+            ys = [p[1] for p in self.analysis_points]
+            if self.current_transform:
+                geo_xs, geo_ys = self.pixel_to_geo(xs, ys)
+            else:
+                geo_xs, geo_ys = xs, ys
+
+            # One transaction and one feature definition/geometry for all points
+            layer_defn = layer.GetLayerDefn()
+            point = ogr.Geometry(ogr.wkbPoint)
+            layer.StartTransaction()
+            for (x, y, name), geo_x, geo_y in zip(self.analysis_points, geo_xs, geo_ys):
                 # Get displacement value
                 disp = 0
-                if name in self.time_series_data and self.time_series_data[name]:
-                    disp = self.time_series_data[name][-1][1] * 1000
-
-                # Convert pixel to geo coordinates if transform available
-                if self.current_transform:
-                    geo_x = self.current_transform[0] + x * self.current_transform[1]
-                    geo_y = self.current_transform[3] + y * self.current_transform[5]
-                else:
-                    geo_x, geo_y = x, y
+                if name in self.time_series_data and len(self.time_series_data[name]['disps']):
+                    disp = float(self.time_series_data[name]['disps'][-1]) * 1000
 
-                feature = ogr.Feature(layer.GetLayerDefn())
+                feature = ogr.Feature(layer_defn)
                 feature.SetField('Name', name)
                 feature.SetField('Disp_mm', disp)
                 feature.SetField('X_pixel', x)
                 feature.SetField('Y_pixel', y)
 
-                point = ogr.Geometry(ogr.wkbPoint)
-                point.AddPoint(geo_x, geo_y)
-                feature.SetGeometry(point)
+                point.SetPoint_2D(0, float(geo_x), float(geo_y))
+                feature.SetGeometry(point)  # Copies the geometry
 
                 layer.CreateFeature(feature)
                 feature = None
+            layer.CommitTransaction()
 
             ds = None
             messagebox.showinfo("Success", f"Shapefile saved to:\n{save_path}")
@@ -1241,19 +1835,27 @@ class LandSubsidenceAnalyzer:
             story.append(Paragraph(f"<b>Analysis Points:</b> {len(self.analysis_points)}", styles['Normal']))
             story.append(Spacer(1, 20))
 
-            # Save figures temporarily
-            import tempfile
-
-            # Displacement map
-            map_path = os.path.join(tempfile.gettempdir(), 'disp_map.png')
-            self.map_fig.savefig(map_path, dpi=150, bbox_inches='tight', facecolor='white')
+            # Displacement map; temp names are unique so reports can overlap
+            fd, map_path = tempfile.mkstemp(prefix='disp_map_', suffix='.png')
+            os.close(fd)
+            temp_paths = [map_path]
+            # savefig skips animated artists
+            if self.map_im is not None:
+                self.set_map_animated(False)
+            try:
+                self.map_fig.savefig(map_path, dpi=150, bbox_inches='tight', facecolor='white')
+            finally:
+                if self.map_im is not None:
+                    self.set_map_animated(True)
             story.append(Paragraph("<b>Displacement Map</b>", styles['Heading2']))
             story.append(Image(map_path, width=6*inch, height=4.5*inch))
             story.append(Spacer(1, 20))
 
             # Time series
             if self.time_series_data:
-                ts_path = os.path.join(tempfile.gettempdir(), 'time_series.png')
+                fd, ts_path = tempfile.mkstemp(prefix='time_series_', suffix='.png')
+                os.close(fd)
+                temp_paths.append(ts_path)
                 self.ts_fig.savefig(ts_path, dpi=150, bbox_inches='tight', facecolor='white')
                 story.append(Paragraph("<b>Displacement Time Series</b>", styles['Heading2']))
                 story.append(Image(ts_path, width=6*inch, height=4*inch))
@@ -1263,14 +1865,11 @@ class LandSubsidenceAnalyzer:
             story.append(Paragraph("<b>Point Statistics</b>", styles['Heading2']))
 
             table_data = [['Point', 'X', 'Y', 'Displacement (mm)']]
-            for name, data in self.time_series_data.items():
-                x, y = 0, 0
-                for px, py, pname in self.analysis_points:
-                    if pname == name:
-                        x, y = px, py
-                        break
+            coords = {name: (x, y) for x, y, name in self.analysis_points}
+            for name, series in self.time_series_data.items():
+                x, y = coords.get(name, (0, 0))
 
-                disp = data[-1][1] * 1000 if data else 0
+                disp = series['disps'][-1] * 1000 if len(series['disps']) else 0
                 table_data.append([name, str(x), str(y), f"{disp:.2f}"])
 
             table = Table(table_data)
@@ -1286,25 +1885,74 @@ class LandSubsidenceAnalyzer:
             ]))
             story.append(table)
 
-            # Build PDF
-            doc.build(story)
+            # The figures are live Tk figures, so they are rendered above on the
+            # main thread; laying out and writing the PDF happens in the background
+            threading.Thread(target=self._report_worker, args=(doc, story, temp_paths, save_path),
+                             daemon=True).start()
 
-            # Cleanup temp files
-            try:
-                os.remove(map_path)
-                if self.time_series_data:
-                    os.remove(ts_path)
-            except:
-                pass
+        except Exception as e:
+            messagebox.showerror("Error", f"Report generation failed: {str(e)}")
 
-            messagebox.showinfo("Success", f"PDF report saved to:\n{save_path}")
-            self.status_var.set("Report generated successfully")
+    def _report_worker(self, doc, story, temp_paths, save_path):
+        """Background worker for building the PDF report"""
+        try:
+            doc.build(story)
+            self.root.after(0, lambda: messagebox.showinfo("Success", f"PDF report saved to:\n{save_path}"))
+            self.root.after(0, lambda: self.status_var.set("Report generated successfully"))
 
         except Exception as e:
-            messagebox.showerror("Error", f"Report generation failed: {str(e)}")
+            self.root.after(0, lambda err=str(e): messagebox.showerror("Error", f"Report generation failed: {err}"))
+            self.root.after(0, lambda: self.status_var.set("Report generation failed"))
+
+        finally:
+            # Cleanup temp files
+            for path in temp_paths:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
 
     # ==================== ASF DOWNLOAD & ISCE2 PROCESSING ====================
 
+    def post_status(self, text):
+        """Set the status bar from a worker thread, via the UI poller"""
+        self._ui_updates.put(('status', text))
+
+    def post_progress(self, value):
+        """Set the download progress bar from a worker thread, via the UI poller"""
+        self._ui_updates.put(('progress', value))
+
+    def start_ui_poll(self):
+        if self._ui_poll_job is None:
+            self._ui_poll_job = self.root.after(UI_POLL_MS, self._poll_ui_updates)
+
+    def apply_ui_updates(self):
+        """Apply the most recent queued status and progress, dropping older ones"""
+        latest = {}
+        try:
+            while True:
+                kind, value = self._ui_updates.get_nowait()
+                latest[kind] = value
+        except Empty:
+            pass
+        if 'status' in latest:
+            self.status_var.set(latest['status'])
+        if 'progress' in latest:
+            self.download_progress.config(value=latest['progress'])
+
+    def _poll_ui_updates(self):
+        self.apply_ui_updates()
+        # Keep polling while a worker runs, plus once for its last updates
+        if self.is_downloading or self.is_processing or not self._ui_updates.empty():
+            self._ui_poll_job = self.root.after(UI_POLL_MS, self._poll_ui_updates)
+        else:
+            self._ui_poll_job = None
+
+    def aoi_bbox(self):
+        """(lat_min, lat_max, lon_min, lon_max) from the AOI entries"""
+        return parse_bbox(self.aoi_lat_min.get(), self.aoi_lat_max.get(),
+                          self.aoi_lon_min.get(), self.aoi_lon_max.get())
+
     def search_asf(self):
         """Search ASF for Sentinel-1 SLC data"""
         if not HAS_ASF:
@@ -1313,10 +1961,7 @@ class LandSubsidenceAnalyzer:
 
         # Validate inputs
         try:
-            lat_min = float(self.aoi_lat_min.get())
-            lat_max = float(self.aoi_lat_max.get())
-            lon_min = float(self.aoi_lon_min.get())
-            lon_max = float(self.aoi_lon_max.get())
+            lat_min, lat_max, lon_min, lon_max = self.aoi_bbox()
         except ValueError:
             messagebox.showerror("Error", "Invalid coordinates. Enter numeric lat/lon values.")
             return
@@ -1366,12 +2011,14 @@ class LandSubsidenceAnalyzer:
             # Sort by date
             self.asf_search_results.sort(key=lambda x: x.properties.get('startTime', ''))
 
-            # Display results
-            for i, result in enumerate(self.asf_search_results):
+            # Display results with a single insert so the listbox lays out once
+            items = []
+            for result in self.asf_search_results:
                 props = result.properties
                 start_time = props.get('startTime', '')[:10]
                 track_num = props.get('pathNumber', 'N/A')
-                self.asf_listbox.insert(tk.END, f"{start_time} | Track {track_num}")
+                items.append(f"{start_time} | Track {track_num}")
+            self.asf_listbox.insert(tk.END, *items)
 
             self.status_var.set(f"Found {len(self.asf_search_results)} scenes")
 
@@ -1401,6 +2048,12 @@ class LandSubsidenceAnalyzer:
             messagebox.showerror("Error", "Enter NASA Earthdata credentials")
             return
 
+        try:
+            workers = int(self.parallel_downloads.get())
+        except (tk.TclError, ValueError):
+            workers = PARALLEL_DOWNLOADS
+        workers = max(1, min(MAX_PARALLEL_DOWNLOADS, workers))
+
         self.selected_pair_indices = list(selection)
 
         # Start download in background thread
@@ -1408,19 +2061,16 @@ class LandSubsidenceAnalyzer:
             messagebox.showwarning("Warning", "Download already in progress")
             return
 
-        self.download_thread = threading.Thread(target=self._download_worker, daemon=True)
+        self.download_thread = threading.Thread(target=self._download_worker, args=(workers,), daemon=True)
         self.download_thread.start()
 
-    def _download_worker(self):
-        """Background worker for downloading SLC data"""
+    def _download_worker(self, workers=PARALLEL_DOWNLOADS):
+        """Background worker for downloading SLC data, up to workers scenes at a time"""
         self.is_downloading = True
-        self.root.after(0, lambda: self.download_btn.config(state=tk.DISABLED))
-        self.root.after(0, lambda: self.status_var.set("Starting download..."))
+        self.root.after(0, self._ui_download_started)
 
         try:
-            # Create session
-            session = asf.ASFSession()
-            session.auth_with_creds(self.earthdata_user.get(), self.earthdata_pass.get())
+            session = self._get_asf_session()
 
             # Create download directory
             download_base = self.download_dir.get()
@@ -1432,26 +2082,226 @@ class LandSubsidenceAnalyzer:
             scenes_to_download = [self.asf_search_results[i] for i in self.selected_pair_indices]
             total = len(scenes_to_download)
 
-            for i, scene in enumerate(scenes_to_download):
-                progress = int((i / total) * 100)
-                self.root.after(0, lambda p=progress: self.download_progress.config(value=p))
-                self.root.after(0, lambda n=scene.properties.get('fileID', 'unknown'):
-                              self.status_var.set(f"Downloading: {n[:40]}..."))
+            self.post_status(f"Downloading {total} scenes, {min(workers, total)} at a time...")
+
+            # Progress advances as each scene finishes, in whatever order
+            with ThreadPoolExecutor(max_workers=min(workers, total)) as pool:
+                futures = {pool.submit(self._download_scene, scene, slc_dir, session): scene
+                           for scene in scenes_to_download}
+                for done, future in enumerate(as_completed(futures), 1):
+                    try:
+                        future.result()
+                    except Exception:
+                        # Don't start the scenes still queued; running ones finish
+                        for pending in futures:
+                            pending.cancel()
+                        raise
+                    name = futures[future].properties.get('fileID', 'unknown')
+                    self.post_progress(int((done / total) * 100))
+                    self.post_status(f"Downloaded {done}/{total}: {name[:40]}")
+
+            self.root.after(0, self._download_done, total, slc_dir)
 
-                scene.download(path=slc_dir, session=session)
+        except Exception as e:
+            self.root.after(0, self._download_failed, str(e))
 
-            self.root.after(0, lambda: self.download_progress.config(value=100))
-            self.root.after(0, lambda: self.status_var.set(f"Downloaded {total} scenes to {slc_dir}"))
-            self.root.after(0, lambda: messagebox.showinfo("Success",
-                f"Downloaded {total} SLC scenes to:\n{slc_dir}"))
+    def _ui_download_started(self):
+        """Switch the controls into download mode, in one UI-thread pass"""
+        self.start_ui_poll()
+        self.download_btn.config(state=tk.DISABLED)
+        self.status_var.set("Starting download...")
 
-        except Exception as e:
-            self.root.after(0, lambda err=str(e): messagebox.showerror("Download Error", f"Download failed:\n{err}"))
-            self.root.after(0, lambda: self.status_var.set("Download failed"))
+    def _finish_download(self):
+        """Leave download mode; called on the UI thread before any dialog"""
+        self.apply_ui_updates()  # Per-scene statuses are older than the result
+        self.is_downloading = False
+        self.download_btn.config(state=tk.NORMAL)
+
+    def _download_done(self, total, slc_dir):
+        self._finish_download()
+        self.download_progress.config(value=100)
+        self.status_var.set(f"Downloaded {total} scenes to {slc_dir}")
+        messagebox.showinfo("Success", f"Downloaded {total} SLC scenes to:\n{slc_dir}")
+
+    def _download_failed(self, error):
+        self._finish_download()
+        self.status_var.set("Download failed")
+        messagebox.showerror("Download Error", f"Download failed:\n{error}")
+
+    def _get_asf_session(self):
+        """Authenticated ASFSession, kept while the Earthdata credentials are unchanged"""
+        user = self.earthdata_user.get()
+        key = (user, hashlib.sha256(self.earthdata_pass.get().encode()).hexdigest())
+        if self._asf_session is not None and self._asf_session[0] == key:
+            return self._asf_session[1]
+
+        session = asf.ASFSession()
+        session.auth_with_creds(user, self.earthdata_pass.get())
+        # Enough pooled keep-alive connections for every scene's range streams
+        pool = MAX_PARALLEL_DOWNLOADS * RANGE_STREAMS
+        retry = Retry(total=DOWNLOAD_RETRIES, backoff_factor=1, status_forcelist=[502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=pool, pool_maxsize=pool, max_retries=retry)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        # Signed S3/CloudFront URLs carry their own credential in the query;
+        # they must not also get the Earthdata login as Basic auth
+        self._signed_session = requests.Session()
+        self._signed_session.mount('https://', adapter)
+        self._signed_session.mount('http://', adapter)
+        self._asf_session = (key, session)
+        return session
+
+    def _download_scene(self, scene, slc_dir, session):
+        """Download one scene into slc_dir, in parallel byte ranges when the server allows"""
+        url = scene.properties.get('url')
+        name = scene.properties.get('fileName')
+        dest = os.path.join(slc_dir, name) if name else None
+        if dest and os.path.exists(dest):
+            if verify_zip(dest):
+                return  # Already downloaded intact
+            # Corrupt: remove it so neither path below (asf_search skips any
+            # existing file) keeps it
+            for path in (dest, dest + '.crc'):
+                if os.path.exists(path):
+                    os.remove(path)
+        if not url or not name:
+            scene.download(path=slc_dir, session=session)
+            return
 
+        # Follow the Earthdata login redirect once; ranges go to the final URL
+        try:
+            head = session.head(url, allow_redirects=True, timeout=60)
+            head.raise_for_status()
+        except RequestException:
+            # Some servers refuse HEAD; a plain download doesn't need it
+            scene.download(path=slc_dir, session=session)
+            return
+        size = int(head.headers.get('Content-Length', 0))
+        if head.headers.get('Accept-Ranges') != 'bytes' or size <= 0:
+            scene.download(path=slc_dir, session=session)
+            return
+        # ASFSession strips its auth when HEAD redirects off the Earthdata
+        # hosts; ranges sent to that redirect target must go without it too
+        redirected = urlsplit(head.url).netloc != urlsplit(url).netloc
+        range_session = self._signed_session if redirected else session
+        if not self._download_ranged(head.url, dest, size, range_session, origin=url, resolver=session):
+            scene.download(path=slc_dir, session=session)
+
+    def _download_ranged(self, url, dest, size, session, origin=None, resolver=None):
+        """Fetch url into dest as RANGE_CHUNK_BYTES ranges on RANGE_STREAMS connections
+
+        Finished ranges are recorded in dest.part.json, so an interrupted
+        download resumes with only the missing ones. url may be a
+        time-limited signed redirect; a range refused with 403 re-resolves
+        it from origin through resolver (default: session). Returns False
+        if the server refuses the first range, for a plain download instead.
+        """
+        part_path = dest + '.part'
+        state_path = dest + '.part.json'
+
+        ranges = [(start, min(start + RANGE_CHUNK_BYTES, size) - 1)
+                  for start in range(0, size, RANGE_CHUNK_BYTES)]
+        done = set()
+        if os.path.exists(part_path) and os.path.exists(state_path):
+            try:
+                with open(state_path) as f:
+                    state = json.load(f)
+                if state.get('size') == size and state.get('url_path') == url.split('?')[0]:
+                    done = set(state['done'])
+            except (OSError, ValueError, KeyError):
+                done = set()
+
+        fd = os.open(part_path, os.O_RDWR | os.O_CREAT | getattr(os, 'O_BINARY', 0), 0o644)
+        lock = threading.Lock()
+        signed = [url]  # Current redirect target, shared by all streams
+
+        def resolve(stale):
+            with lock:
+                if signed[0] == stale:  # Not already refreshed by another stream
+                    head = (resolver or session).head(origin, allow_redirects=True, timeout=60)
+                    head.raise_for_status()
+                    signed[0] = head.url
+                return signed[0]
+
+        def fetch(k, probe=False):
+            start, end = ranges[k]
+            offset = start
+            headers = {'Range': f'bytes={start}-{end}'}
+            current = signed[0]
+            r = session.get(current, headers=headers, stream=True, timeout=60)
+            retries = 2
+            while r.status_code == 403 and origin and retries:
+                r.close()  # Signed URL expired during a long download
+                current = resolve(current)
+                r = session.get(current, headers=headers, stream=True, timeout=60)
+                retries -= 1
+            with r:
+                if probe and r.status_code != 206:
+                    return False  # Ranges refused or ignored
+                r.raise_for_status()
+                if r.status_code != 206:
+                    raise IOError("Server ignored the byte range request")
+                if HAS_PWRITE:
+                    # Unbuffered positional writes; no seek, so threads share fd
+                    for block in r.iter_content(1 << 20):
+                        # pwrite may write short; finish the block before the next
+                        view = memoryview(block)
+                        while view:
+                            n = os.pwrite(fd, view, offset)
+                            view = view[n:]
+                            offset += n
+                else:
+                    with open(part_path, 'r+b') as f:
+                        f.seek(start)
+                        for block in r.iter_content(1 << 20):
+                            f.write(block)
+                            offset += len(block)
+            if offset != end + 1:
+                raise IOError(f"Incomplete range {start}-{end} of {os.path.basename(dest)}")
+            with lock:
+                done.add(k)
+                with open(state_path, 'w') as f:
+                    json.dump({'size': size, 'url_path': url.split('?')[0], 'done': sorted(done)}, f)
+            return True
+
+        pending = [k for k in range(len(ranges)) if k not in done]
+        try:
+            if not done:
+                # Allocate the whole file up front so every range can write at
+                # its offset without fragmenting it; sparse if the FS can't
+                os.ftruncate(fd, 0)
+                try:
+                    os.posix_fallocate(fd, 0, size)
+                except (AttributeError, OSError):
+                    os.ftruncate(fd, size)
+
+            # The first range alone shows whether the server honours ranges
+            if pending and not fetch(pending[0], probe=True):
+                os.close(fd)
+                fd = None
+                for path in (part_path, state_path):
+                    if os.path.exists(path):
+                        os.remove(path)
+                return False
+
+            with ThreadPoolExecutor(max_workers=RANGE_STREAMS) as pool:
+                futures = [pool.submit(fetch, k) for k in pending[1:]]
+                try:
+                    for future in futures:
+                        future.result()
+                except Exception:
+                    # Don't start the ranges still queued; running ones finish
+                    for future in futures:
+                        future.cancel()
+                    raise
         finally:
-            self.is_downloading = False
-            self.root.after(0, lambda: self.download_btn.config(state=tk.NORMAL))
+            if fd is not None:
+                os.close(fd)
+
+        os.replace(part_path, dest)
+        if os.path.exists(state_path):
+            os.remove(state_path)
+        return True
 
     def run_isce2_processing(self):
         """Run ISCE2 topsApp.py processing"""
@@ -1467,20 +2317,32 @@ class LandSubsidenceAnalyzer:
             messagebox.showerror("Error", f"SLC directory not found:\n{slc_dir}\n\nDownload data first.")
             return
 
-        # Find SAFE files
-        safe_files = glob.glob(os.path.join(slc_dir, "*.zip")) + glob.glob(os.path.join(slc_dir, "*.SAFE"))
+        # Find SAFE files in one directory pass; the earliest two by name (date) are the pair
+        with os.scandir(slc_dir) as entries:
+            safe_files = heapq.nsmallest(2, (e.path for e in entries
+                                             if e.name.endswith(('.zip', '.SAFE'))
+                                             and not e.name.startswith('.')))
 
         if len(safe_files) < 2:
             messagebox.showerror("Error", "Need at least 2 SLC files for InSAR processing")
             return
 
-        # Sort by date (filename contains date)
-        safe_files.sort()
-
         # Use first as reference, second as secondary
         reference_safe = safe_files[0]
         secondary_safe = safe_files[1]
 
+        # topsApp.py needs both scenes on the same track; catch a mismatch
+        # from the manifests now rather than partway through processing
+        ref_meta = peek_safe_metadata(reference_safe) or {}
+        sec_meta = peek_safe_metadata(secondary_safe) or {}
+        if 'relative_orbit' in ref_meta and 'relative_orbit' in sec_meta \
+                and ref_meta['relative_orbit'] != sec_meta['relative_orbit']:
+            messagebox.showerror("Error",
+                f"Reference and secondary are on different tracks "
+                f"(relative orbit {ref_meta['relative_orbit']} vs {sec_meta['relative_orbit']}):\n"
+                f"{os.path.basename(reference_safe)}\n{os.path.basename(secondary_safe)}")
+            return
+
         # Create processing directory
         proc_dir = os.path.join(download_base, "processing")
         os.makedirs(proc_dir, exist_ok=True)
@@ -1495,135 +2357,163 @@ class LandSubsidenceAnalyzer:
         # Start processing in background
         self.processing_thread = threading.Thread(
             target=self._isce2_worker,
-            args=(proc_dir,),
+            args=(proc_dir, reference_safe, secondary_safe),
             daemon=True
         )
         self.processing_thread.start()
 
     def _generate_isce2_config(self, ref_safe, sec_safe, proc_dir):
         """Generate ISCE2 topsApp.xml configuration"""
-        # Get AOI for geocoding
+        # Get AOI for geocoding; without a complete one, geocode the full scene
         try:
-            lat_min = float(self.aoi_lat_min.get())
-            lat_max = float(self.aoi_lat_max.get())
-            lon_min = float(self.aoi_lon_min.get())
-            lon_max = float(self.aoi_lon_max.get())
+            lat_min, lat_max, lon_min, lon_max = self.aoi_bbox()
             geocode_bbox = f"[{lat_min}, {lat_max}, {lon_min}, {lon_max}]"
-        except:
+        except ValueError:
             geocode_bbox = None
 
         # Use forward slashes for ISCE2 (even on Windows)
         ref_safe = ref_safe.replace('\\', '/')
         sec_safe = sec_safe.replace('\\', '/')
 
-        # Main topsApp.xml
-        topsapp_xml = f'''<?xml version="1.0" encoding="UTF-8"?>
-<topsApp>
-    <component name="topsinsar">
-        <property name="Sensor name">SENTINEL1</property>
-
-        <component name="reference">
-            <property name="safe">{ref_safe}</property>
-            <property name="output directory">reference</property>
-        </component>
-
-        <component name="secondary">
-            <property name="safe">{sec_safe}</property>
-            <property name="output directory">secondary</property>
-        </component>
-
-        <property name="do unwrap">True</property>
-        <property name="unwrapper name">snaphu_mcf</property>
-
-        <property name="do ESD">True</property>
-
-        <property name="range looks">7</property>
-        <property name="azimuth looks">2</property>
-        <property name="filter strength">0.5</property>
+        # Main topsApp.xml; ElementTree escapes the path and bbox text
+        root = copy.deepcopy(TOPSAPP_TEMPLATE)
+        insar = root.find('component')
+        insar.find('component[@name="reference"]/property[@name="safe"]').text = ref_safe
+        insar.find('component[@name="secondary"]/property[@name="safe"]').text = sec_safe
+        bbox = insar.find('property[@name="geocode bounding box"]')
+        if geocode_bbox:
+            bbox.text = geocode_bbox
+        else:
+            list(insar)[-2].tail = bbox.tail
+            insar.remove(bbox)
+        topsapp_xml = ('<?xml version="1.0" encoding="UTF-8"?>\n'
+                       + ET.tostring(root, encoding='unicode') + '\n')
 
-        {f'<property name="geocode bounding box">{geocode_bbox}</property>' if geocode_bbox else ''}
+        # Skip the rewrite when the same config is already on disk
+        config_path = os.path.join(proc_dir, "topsApp.xml")
+        hash_path = config_path + ".hash"
+        key = hashlib.sha1(topsapp_xml.encode()).hexdigest()
+        if os.path.exists(config_path) and os.path.exists(hash_path):
+            with open(hash_path) as f:
+                if f.read().strip() == key:
+                    self.status_var.set(f"Config unchanged: {config_path}")
+                    return
 
-    </component>
-</topsApp>
-'''
         # Write config file
-        config_path = os.path.join(proc_dir, "topsApp.xml")
         with open(config_path, 'w') as f:
             f.write(topsapp_xml)
+        with open(hash_path, 'w') as f:
+            f.write(key)
 
         self.status_var.set(f"Config written to {config_path}")
 
-    def _isce2_worker(self, proc_dir):
+    def _isce2_worker(self, proc_dir, ref_safe, sec_safe):
         """Background worker for ISCE2 processing"""
         self.is_processing = True
-        self.root.after(0, lambda: self.process_btn.config(state=tk.DISABLED))
-        self.root.after(0, lambda: self.status_var.set("Starting ISCE2 processing..."))
-        self.root.after(0, lambda: self.download_progress.config(mode='indeterminate'))
-        self.root.after(0, lambda: self.download_progress.start(10))
+        self.root.after(0, self._ui_isce2_started)
 
+        returncode, error = None, None
         try:
-            conda_env = self.conda_env.get().strip() or "isce2"
+            # A truncated or corrupt zip would only fail deep inside topsApp.py
+            zips = [p for p in (ref_safe, sec_safe) if p.endswith('.zip') and not zip_verified(p)]
+            if zips:
+                self.post_status("Verifying SLC zips...")
+            # Check each unverified zip in its own process, all at once
+            results = self._get_cpu_pool().map(verify_zip, zips) if len(zips) > 1 else map(verify_zip, zips)
+            bad = [os.path.basename(p) for p, ok in zip(zips, results) if not ok]
+            if bad:
+                raise IOError("Corrupt or incomplete SLC download:\n" + "\n".join(bad)
+                              + "\n\nDelete and download again.")
 
-            # Build command
-            cmd = f'conda run -n {conda_env} topsApp.py topsApp.xml'
-
-            self.root.after(0, lambda: self.status_var.set(f"Running: {cmd}"))
-
-            # Run ISCE2
-            process = subprocess.Popen(
-                cmd,
-                shell=True,
-                cwd=proc_dir,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True
-            )
+            conda_env = self.conda_env.get().strip() or "isce2"
 
-            # Monitor output
-            for line in process.stdout:
-                line = line.strip()
-                if line:
-                    # Update status with current step
-                    if 'runPreprocessor' in line:
-                        self.root.after(0, lambda: self.status_var.set("ISCE2: Preprocessing..."))
-                    elif 'runTopo' in line:
-                        self.root.after(0, lambda: self.status_var.set("ISCE2: Computing topography..."))
-                    elif 'runBurstIfg' in line:
-                        self.root.after(0, lambda: self.status_var.set("ISCE2: Creating interferograms..."))
-                    elif 'runMergeBursts' in line:
-                        self.root.after(0, lambda: self.status_var.set("ISCE2: Merging bursts..."))
-                    elif 'runFilter' in line:
-                        self.root.after(0, lambda: self.status_var.set("ISCE2: Filtering..."))
-                    elif 'runUnwrap' in line:
-                        self.root.after(0, lambda: self.status_var.set("ISCE2: Unwrapping phase..."))
-                    elif 'runGeocode' in line:
-                        self.root.after(0, lambda: self.status_var.set("ISCE2: Geocoding..."))
-
-            process.wait()
-
-            if process.returncode == 0:
-                self.root.after(0, lambda: self.status_var.set("ISCE2 processing complete!"))
-                self.root.after(0, lambda: messagebox.showinfo("Success",
-                    f"ISCE2 processing complete!\n\nResults in:\n{os.path.join(proc_dir, 'merged')}"))
-
-                # Auto-load results
-                merged_dir = os.path.join(proc_dir, "merged")
-                if os.path.exists(merged_dir):
-                    self.root.after(0, lambda: self._load_isce2_results(merged_dir))
-            else:
-                self.root.after(0, lambda: messagebox.showerror("Error",
-                    f"ISCE2 processing failed with return code {process.returncode}"))
-                self.root.after(0, lambda: self.status_var.set("ISCE2 processing failed"))
+            # Build command; run directly rather than through a shell. The full
+            # path from which() also lets Windows launch conda.bat without one
+            cmd = [shutil.which('conda') or 'conda', 'run', '--no-capture-output',
+                   '-n', conda_env, 'topsApp.py', 'topsApp.xml']
+
+            self.post_status(f"Running: conda run -n {conda_env} topsApp.py topsApp.xml")
+
+            # Run ISCE2 with output going straight to topsApp.log rather than
+            # through a pipe; unbuffered, each step name lands as it is printed
+            log_path = os.path.join(proc_dir, "topsApp.log")
+            with open(log_path, 'wb') as log:
+                process = subprocess.Popen(
+                    cmd,
+                    cwd=proc_dir,
+                    stdout=log,
+                    stderr=subprocess.STDOUT,
+                    env=dict(os.environ, PYTHONUNBUFFERED='1')
+                )
+
+            # Monitor output: scan only the bytes added since the last poll,
+            # keeping a short tail in case a step name spans two reads
+            keep = max(len(step) for step in ISCE2_STEPS) - 1
+            tail = b''
+            step = None
+            with open(log_path, 'rb') as log:
+                while True:
+                    try:
+                        process.wait(timeout=ISCE2_LOG_POLL_S)
+                        finished = True
+                    except subprocess.TimeoutExpired:
+                        finished = False
+                    chunk = tail + log.read()
+                    matches = ISCE2_STEP_PATTERN.findall(chunk)
+                    if matches and matches[-1].decode() != step:
+                        # Update status with current step
+                        step = matches[-1].decode()
+                        self.post_status(ISCE2_STEPS[step])
+                    tail = chunk[-keep:]
+                    if finished:
+                        break
+            returncode = process.returncode
 
         except Exception as e:
-            self.root.after(0, lambda err=str(e): messagebox.showerror("Error", f"ISCE2 failed:\n{err}"))
-            self.root.after(0, lambda: self.status_var.set("ISCE2 processing failed"))
+            error = str(e)
 
         finally:
             self.is_processing = False
-            self.root.after(0, lambda: self.process_btn.config(state=tk.NORMAL))
-            self.root.after(0, lambda: self.download_progress.stop())
-            self.root.after(0, lambda: self.download_progress.config(mode='determinate', value=0))
+            self.root.after(0, self._ui_isce2_finished, proc_dir, returncode, error)
+
+    def _get_cpu_pool(self):
+        """Process pool for CPU-bound per-scene work, shut down at exit"""
+        if self._cpu_pool is None:
+            # Spawn, not fork: this process runs Tk, GDAL and numba threads
+            self._cpu_pool = ProcessPoolExecutor(max_workers=max(2, (os.cpu_count() or 2) // 2),
+                                                 mp_context=multiprocessing.get_context('spawn'))
+            atexit.register(self._cpu_pool.shutdown, wait=False, cancel_futures=True)
+        return self._cpu_pool
+
+    def _ui_isce2_started(self):
+        """Switch the controls into processing mode, in one UI-thread pass"""
+        self.start_ui_poll()
+        self.process_btn.config(state=tk.DISABLED)
+        self.status_var.set("Starting ISCE2 processing...")
+        self.download_progress.config(mode='indeterminate')
+        self.download_progress.start(10)
+
+    def _ui_isce2_finished(self, proc_dir, returncode, error=None):
+        """Restore the controls and report how topsApp.py ended"""
+        self.apply_ui_updates()  # Queued step statuses are older than this
+        self.process_btn.config(state=tk.NORMAL)
+        self.download_progress.stop()
+        self.download_progress.config(mode='determinate', value=0)
+
+        merged_dir = os.path.join(proc_dir, "merged")
+        if error is not None:
+            self.status_var.set("ISCE2 processing failed")
+            messagebox.showerror("Error", f"ISCE2 failed:\n{error}")
+        elif returncode != 0:
+            self.status_var.set("ISCE2 processing failed")
+            messagebox.showerror("Error", f"ISCE2 processing failed with return code {returncode}")
+        else:
+            self.status_var.set("ISCE2 processing complete!")
+            messagebox.showinfo("Success", f"ISCE2 processing complete!\n\nResults in:\n{merged_dir}")
+
+            # Auto-load results
+            if os.path.exists(merged_dir):
+                self._load_isce2_results(merged_dir)
 
     def _load_isce2_results(self, merged_dir):
         """Load ISCE2 output files into the analyzer"""
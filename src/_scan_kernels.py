@@ -0,0 +1,69 @@
+"""
+Numba scan kernels for the web app
+===================================
+Kept out of ASF_InSAR_Web_App.py because Streamlit re-executes that script
+on every rerun; imported from here they compile once per process and are
+cached on disk across processes.
+
+The web app calls these from decode worker threads, which numba's default
+workqueue layer does not survive, so the kernels only run in parallel on a
+thread-safe layer (TBB or OpenMP) and fall back to serial code otherwise.
+"""
+
+import numba
+import numpy as np
+from numba import njit, prange
+
+SCAN_CHUNKS = 64
+
+# Respect an explicit tbb/omp choice; otherwise take whichever of them loads
+if numba.config.THREADING_LAYER not in ('tbb', 'omp'):
+    numba.config.THREADING_LAYER = 'threadsafe'
+
+
+def _scan_stats(flat, nodata):
+    """Replace nodata with NaN in place while accumulating min/max/sum/count"""
+    n = flat.size
+    step = (n + SCAN_CHUNKS - 1) // SCAN_CHUNKS
+    mins = np.full(SCAN_CHUNKS, np.inf)
+    maxs = np.full(SCAN_CHUNKS, -np.inf)
+    sums = np.zeros(SCAN_CHUNKS)
+    counts = np.zeros(SCAN_CHUNKS, np.int64)
+    for c in prange(SCAN_CHUNKS):
+        for i in range(c * step, min(n, (c + 1) * step)):
+            x = flat[i]
+            if x == nodata:
+                flat[i] = np.nan
+            elif np.isfinite(x):
+                mins[c] = min(mins[c], x)
+                maxs[c] = max(maxs[c], x)
+                sums[c] += x
+                counts[c] += 1
+    return mins.min(), maxs.max(), sums.sum(), counts.sum()
+
+
+def _scan_hist(flat, lo, hi, bins):
+    """Histogram of finite values over [lo, hi]; one row per chunk avoids races"""
+    n = flat.size
+    step = (n + SCAN_CHUNKS - 1) // SCAN_CHUNKS
+    hist = np.zeros((SCAN_CHUNKS, bins), np.int64)
+    scale = bins / (hi - lo)
+    for c in prange(SCAN_CHUNKS):
+        for i in range(c * step, min(n, (c + 1) * step)):
+            x = flat[i]
+            if np.isfinite(x):
+                k = min(int((x - lo) * scale), bins - 1)
+                hist[c, k] += 1
+    return hist.sum(axis=0)
+
+
+try:
+    scan_stats = njit(parallel=True, cache=True)(_scan_stats)
+    scan_hist = njit(parallel=True, cache=True)(_scan_hist)
+    # The first parallel call loads the threading layer; fails if neither loads
+    scan_stats(np.zeros(1, np.float32), np.float32(np.nan))
+    PARALLEL = True
+except ValueError:
+    scan_stats = njit(cache=True)(_scan_stats)
+    scan_hist = njit(cache=True)(_scan_hist)
+    PARALLEL = False